@@ -1,8 +1,16 @@
 
-from PyQt5.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QTextEdit, QPushButton, QMessageBox, QMenuBar, QMenu, QAction
-from PyQt5.QtGui import QFont, QIcon
+from PyQt5.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QTextEdit, QPushButton, QMessageBox, QMenuBar, QMenu, QAction, QProgressBar, QPlainTextEdit, QFileDialog
+from PyQt5.QtCore import QThread, QTimer
+from PyQt5.QtGui import QFont, QIcon, QTextCursor
 from help_dialog import HelpDialog
 from encryption_manager import EncryptionManager
+from crypto_worker import CryptoWorker
+
+# Çıktı görünüme bu boyutta parçalarla eklenir; en fazla DISPLAY_LIMIT karakter
+# gösterilir, tamamı "Dosyaya Kaydet" ile diske yazılır.
+DISPLAY_CHUNK = 1 << 16
+DISPLAY_LIMIT = 1 << 21
+SAVE_CHUNK = 1 << 20
 
 
 class EncryptionApp(QMainWindow):
@@ -10,6 +18,10 @@ class EncryptionApp(QMainWindow):
         super().__init__()
 
         self.encryption_manager = EncryptionManager(shared_key) 
+        self.worker_thread = None
+        self.worker = None
+        self.result_text = ''
+        self.display_offset = 0
         
         self.initUI()
     
@@ -28,7 +40,7 @@ class EncryptionApp(QMainWindow):
                 color: white;
                 font-size: 14px;
             }
-            QTextEdit {
+            QTextEdit, QPlainTextEdit {
                 background-color: #3C3C3C;
                 color: white;
                 border: 1px solid #555;
@@ -57,29 +69,54 @@ class EncryptionApp(QMainWindow):
         self.input_text = QTextEdit()
 
         output_label = QLabel("Şifrelenmiş Metin:")
-        self.output_text = QTextEdit()
+        self.output_text = QPlainTextEdit()
         self.output_text.setReadOnly(True)
+        self.output_text.setUndoRedoEnabled(False)
+
+        self.output_note = QLabel()
+        self.output_note.setVisible(False)
+
+        self.save_button = QPushButton("Dosyaya Kaydet")
+        self.save_button.clicked.connect(self.save_output)
+        self.save_button.setEnabled(False)
+        self.save_button.setFixedSize(200, 34)
+
+        self.display_timer = QTimer(self)
+        self.display_timer.timeout.connect(self.feed_output)
 
         button_layout = QHBoxLayout()
-        encrypt_button = QPushButton("Şifrele")
-        encrypt_button.clicked.connect(self.encrypt_message)
-        decrypt_button = QPushButton("Çöz")
-        decrypt_button.clicked.connect(self.decrypt_message)
+        self.encrypt_button = QPushButton("Şifrele")
+        self.encrypt_button.clicked.connect(self.encrypt_message)
+        self.decrypt_button = QPushButton("Çöz")
+        self.decrypt_button.clicked.connect(self.decrypt_message)
+        self.cancel_button = QPushButton("İptal")
+        self.cancel_button.clicked.connect(self.cancel_job)
+        self.cancel_button.setEnabled(False)
+
+        button_layout.addWidget(self.encrypt_button)
+        button_layout.addWidget(self.decrypt_button)
+        button_layout.addWidget(self.cancel_button)
 
-        button_layout.addWidget(encrypt_button)
-        button_layout.addWidget(decrypt_button)
+        self.encrypt_button.setFixedSize(200, 34)
+        self.encrypt_button.setStyleSheet("background-color: #4CAF50; color: black;")
 
-        encrypt_button.setFixedSize(200, 34)
-        encrypt_button.setStyleSheet("background-color: #4CAF50; color: black;")
+        self.decrypt_button.setFixedSize(200, 34) 
+        self.decrypt_button.setStyleSheet("background-color: #FF9800; color: black;") 
 
-        decrypt_button.setFixedSize(200, 34) 
-        decrypt_button.setStyleSheet("background-color: #FF9800; color: black;") 
+        self.cancel_button.setFixedSize(120, 34)
+
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 100)
+        self.progress_bar.setVisible(False)
 
         layout.addWidget(input_label)
         layout.addWidget(self.input_text)
         layout.addLayout(button_layout)
+        layout.addWidget(self.progress_bar)
         layout.addWidget(output_label)
         layout.addWidget(self.output_text)
+        layout.addWidget(self.output_note)
+        layout.addWidget(self.save_button)
 
         widget = QWidget()
         widget.setLayout(layout)
@@ -104,23 +141,104 @@ class EncryptionApp(QMainWindow):
         if not plain_text:
             QMessageBox.warning(self, "Hata", "Lütfen şifrelenecek mesajı giriniz.")
             return
-        try:
-            cipher_text = self.encryption_manager.encrypt(plain_text)
-            self.output_text.setPlainText(cipher_text)
-        except ValueError as e:
-            QMessageBox.warning(self, "Hata", str(e))
+        self.start_job("encrypt", plain_text)
 
     def decrypt_message(self):
         cipher_text = self.input_text.toPlainText().strip()
         if not cipher_text:
             QMessageBox.warning(self, "Hata", "Lütfen çözülecek mesajı giriniz.")
             return
+        self.start_job("decrypt", cipher_text)
+
+    def start_job(self, mode: str, text: str):
+        # Şifreleme arayüz iş parçacığını bloklamaması için ayrı bir QThread'de yürür.
+        self.set_busy(True)
+        self.worker_thread = QThread(self)
+        self.worker = CryptoWorker(self.encryption_manager, mode, text)
+        self.worker.moveToThread(self.worker_thread)
+
+        self.worker_thread.started.connect(self.worker.run)
+        self.worker.progress.connect(self.progress_bar.setValue)
+        self.worker.result.connect(self.show_result)
+        self.worker.error.connect(self.show_error)
+        self.worker.cancelled.connect(self.show_cancelled)
+        self.worker.finished.connect(self.worker_thread.quit)
+        self.worker.finished.connect(self.worker.deleteLater)
+        self.worker_thread.finished.connect(self.worker_thread.deleteLater)
+        self.worker_thread.finished.connect(self.job_finished)
+
+        self.worker_thread.start()
+
+    def cancel_job(self):
+        if self.worker is not None:
+            self.worker.cancel()
+            self.cancel_button.setEnabled(False)
+
+    def show_result(self, text: str):
+        # Çıktı tek seferde yerleştirilmez; olay döngüsü arasında parça parça eklenir.
+        self.result_text = text
+        self.display_offset = 0
+        self.output_text.clear()
+        if len(text) > DISPLAY_LIMIT:
+            self.output_note.setText(f"Çıktının ilk {DISPLAY_LIMIT} karakteri gösteriliyor ({len(text)} karakter). Tamamı için dosyaya kaydedin.")
+            self.output_note.setVisible(True)
+        else:
+            self.output_note.setVisible(False)
+        self.display_timer.start(0)
+
+    def feed_output(self):
+        end = min(self.display_offset + DISPLAY_CHUNK, len(self.result_text), DISPLAY_LIMIT)
+        self.output_text.moveCursor(QTextCursor.End)
+        self.output_text.insertPlainText(self.result_text[self.display_offset:end])
+        self.display_offset = end
+        if end >= min(len(self.result_text), DISPLAY_LIMIT):
+            self.display_timer.stop()
+            self.output_text.moveCursor(QTextCursor.Start)
+
+    def save_output(self):
+        path, _ = QFileDialog.getSaveFileName(self, "Çıktıyı Kaydet", "", "Metin Dosyaları (*.txt);;Tüm Dosyalar (*)")
+        if not path:
+            return
         try:
-            plain_text = self.encryption_manager.decrypt(cipher_text)
-            self.output_text.setPlainText(plain_text)
-        except ValueError as e:
+            with open(path, 'w', encoding='utf-8', newline='') as f:
+                for start in range(0, len(self.result_text), SAVE_CHUNK):
+                    f.write(self.result_text[start:start + SAVE_CHUNK])
+        except OSError as e:
             QMessageBox.warning(self, "Hata", str(e))
 
+    def show_cancelled(self):
+        # Önceki sonuç güncelmiş gibi görünmesin diye çıktı temizlenir.
+        self.result_text = ''
+        self.display_offset = 0
+        self.output_text.clear()
+        self.output_note.setText("İşlem iptal edildi.")
+        self.output_note.setVisible(True)
+
+    def show_error(self, message: str):
+        QMessageBox.warning(self, "Hata", message)
+
+    def job_finished(self):
+        self.worker_thread = None
+        self.worker = None
+        self.set_busy(False)
+
+    def set_busy(self, busy: bool):
+        if busy:
+            self.display_timer.stop()
+        self.save_button.setEnabled(not busy and bool(self.result_text))
+        self.encrypt_button.setEnabled(not busy)
+        self.decrypt_button.setEnabled(not busy)
+        self.cancel_button.setEnabled(busy)
+        self.progress_bar.setValue(0)
+        self.progress_bar.setVisible(busy)
+
+    def closeEvent(self, event):
+        if self.worker_thread is not None:
+            self.worker.cancel()
+            self.worker_thread.quit()
+            self.worker_thread.wait()
+        super().closeEvent(event)
+
     def center(self):
         screen = self.screen().geometry()
         window_geometry = self.frameGeometry()
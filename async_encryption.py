@@ -0,0 +1,109 @@
+import asyncio
+from concurrent.futures import Executor
+from typing import Optional
+from encryption_manager import EncryptionManager
+
+DEFAULT_MAX_CONCURRENCY = 8
+# Bu uzunluğa kadar olan mesajlar kısa bir pencere boyunca toplanıp tek iş
+# olarak yürütücüye gönderilir.
+DEFAULT_BATCH_MAX_LENGTH = 256
+DEFAULT_BATCH_MAX_SIZE = 64
+DEFAULT_BATCH_WINDOW = 0.002
+
+
+class AsyncEncryptionManager:
+    """
+    EncryptionManager için asyncio arabirimi. Şifreleme olay döngüsünü
+    bloklamamak için yürütücüde çalışır; aynı anda yürütücüde bekleyen iş sayısı
+    bir semafor ile sınırlanır. Birbirine yakın gelen kısa mesajlar
+    encrypt_many/decrypt_many ile tek işte toplanır.
+    """
+    def __init__(self, manager: EncryptionManager, executor: Optional[Executor] = None,
+                 max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                 batch_max_length: int = DEFAULT_BATCH_MAX_LENGTH,
+                 batch_max_size: int = DEFAULT_BATCH_MAX_SIZE,
+                 batch_window: float = DEFAULT_BATCH_WINDOW):
+        if max_concurrency < 1:
+            raise ValueError("Eşzamanlılık sınırı en az 1 olmalıdır.")
+        self._manager = manager
+        self._executor = executor
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._batch_max_length = batch_max_length
+        self._batch_max_size = batch_max_size
+        self._batch_window = batch_window
+        self._pending = {"encrypt_many": [], "decrypt_many": []}
+        self._timers = {}
+        self._tasks = set()
+
+    async def encrypt(self, message: str) -> str:
+        if len(message) <= self._batch_max_length:
+            return await self._enqueue("encrypt_many", message)
+        return await self._run(self._manager.encrypt, message)
+
+    async def decrypt(self, cipher_text: str) -> str:
+        if len(cipher_text) <= self._batch_max_length:
+            return await self._enqueue("decrypt_many", cipher_text)
+        return await self._run(self._manager.decrypt, cipher_text)
+
+    async def encrypt_bytes(self, data) -> bytes:
+        return await self._run(self._manager.encrypt_bytes, data)
+
+    async def decrypt_bytes(self, data) -> bytes:
+        return await self._run(self._manager.decrypt_bytes, data)
+
+    async def _run(self, func, *args):
+        async with self._semaphore:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    def _enqueue(self, operation: str, item):
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        pending = self._pending[operation]
+        pending.append((item, future))
+
+        if len(pending) >= self._batch_max_size:
+            self._flush(operation)
+        elif operation not in self._timers:
+            self._timers[operation] = loop.call_later(self._batch_window, self._flush, operation)
+        return future
+
+    def _flush(self, operation: str):
+        timer = self._timers.pop(operation, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._pending[operation]
+        if not batch:
+            return
+        self._pending[operation] = []
+        task = asyncio.get_running_loop().create_task(self._dispatch(operation, batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self, operation: str, batch):
+        try:
+            results = await self._run(getattr(self._manager, operation), [item for item, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if result.ok:
+                future.set_result(result.value)
+            else:
+                future.set_exception(result.error)
+
+    async def flush(self):
+        for operation in list(self._pending):
+            self._flush(operation)
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.flush()
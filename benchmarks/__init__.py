@@ -0,0 +1,11 @@
+"""
+Gerçek EncryptionManager kod yollarını ölçen benchmark paketi.
+
+    python -m benchmarks throughput [--quick] [--save-baseline | --check]
+    python -m benchmarks latency [--quick]
+    python -m benchmarks memory [--quick]
+    python -m benchmarks small [--quick]
+
+Sonuçlar results/ altına JSON olarak yazılır; kayıtlı temel çizgiye göre
+gerileme varsa komut sıfırdan farklı çıkış koduyla biter.
+"""
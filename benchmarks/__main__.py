@@ -0,0 +1,71 @@
+import argparse
+import sys
+import os
+import time
+from benchmarks import latency, memory, small, throughput
+from benchmarks.common import DEFAULT_TOLERANCE, RESULTS_DIR, baseline_path, find_regressions, save_baseline, write_report
+
+# Her benchmark: (modül, gerileme ölçütü, büyük değer daha mı iyi). Süre ölçen
+# benchmark'lar en iyi tekrarı (best_s) karşılaştırır; medyan ve yüzdelikler
+# aynı kodda bile tolerans dışına çıkacak kadar gürültülüdür.
+BENCHMARKS = {
+    "throughput": (throughput, "best_s", False),
+    "latency": (latency, "best_s", False),
+    "memory": (memory, "peak_ratio", False),
+    "small": (small, "best_s", False),
+}
+# Süre gerilemesi raporlanmadan önce işaretlenen durumlar en fazla bu kadar
+# yeniden ölçülür; her tekrardan önce beklenir ki birkaç saniyelik sistem
+# yavaşlaması geçsin ve kapıyı düşürmesin.
+CONFIRM_RUNS = 3
+CONFIRM_DELAY = 5.0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="KILIM benchmark paketi")
+    parser.add_argument("benchmark", choices=sorted(BENCHMARKS))
+    parser.add_argument("--quick", action="store_true", help="küçük boyutlar ve kısa turlar")
+    parser.add_argument("--output-dir", default=RESULTS_DIR)
+    parser.add_argument("--save-baseline", action="store_true", help="sonuçları temel çizgi olarak kaydeder")
+    parser.add_argument("--check", action="store_true", help="temel çizgiye göre gerilemede hata verir")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="izin verilen göreli kötüleşme (varsayılan: %(default)s)")
+    args = parser.parse_args(argv)
+
+    module, metric, higher_is_better = BENCHMARKS[args.benchmark]
+    # Karşılaştırılacak temel çizgi yoksa uzun ölçüme hiç başlanmaz.
+    if args.check and not args.save_baseline and not os.path.exists(baseline_path(args.benchmark, args.output_dir)):
+        print(f"Temel çizgi bulunamadı: {baseline_path(args.benchmark, args.output_dir)} "
+              f"(önce --save-baseline ile kaydedin)", file=sys.stderr)
+        return 2
+    results = module.run(quick=args.quick)
+
+    if args.check:
+        regressions = find_regressions(args.benchmark, results, metric, higher_is_better,
+                                       args.tolerance, args.output_dir)
+        if metric == "best_s":
+            rows = {row["case"]: row for row in results}
+            for _ in range(CONFIRM_RUNS):
+                if not regressions:
+                    break
+                print(f"\n{len(regressions)} durum yeniden ölçülüyor...", flush=True)
+                time.sleep(CONFIRM_DELAY)
+                for row in module.run(quick=args.quick, only={case for case, _, _ in regressions}):
+                    rows[row["case"]]["best_s"] = min(rows[row["case"]]["best_s"], row["best_s"])
+                regressions = find_regressions(args.benchmark, results, metric, higher_is_better,
+                                               args.tolerance, args.output_dir)
+
+    print(f"\nSonuçlar: {write_report(args.benchmark, results, args.output_dir)}")
+    if args.save_baseline:
+        print(f"Temel çizgi kaydedildi: {save_baseline(args.benchmark, results, args.output_dir)}")
+    if args.check:
+        for case, expected, current in regressions:
+            print(f"GERİLEME {case}: {metric} {expected:.4g} -> {current:.4g}")
+        if regressions:
+            return 1
+        print(f"Gerileme yok (tolerans %{args.tolerance * 100:.0f}).")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
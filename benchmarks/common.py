@@ -0,0 +1,90 @@
+import json
+import os
+import platform
+import random
+import sys
+import time
+from encryption_manager import ALPHABET, NUMPY_AVAILABLE, np
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "results")
+DEFAULT_TOLERANCE = 0.15
+
+TEXT_POOL = "abcçdefgğhıijklmnoöprsştuüvyzABCÇDEFGĞHIİJKLMNOÖPRSŞTUÜVYZ0123456789 .,!?"
+
+
+def make_text(size: int, seed: int = 0) -> str:
+    return "".join(random.Random(seed).choices(TEXT_POOL, k=size))
+
+
+def make_bytes(size: int, seed: int = 0) -> bytes:
+    return random.Random(seed).randbytes(size)
+
+
+def engines():
+    return ("python", "numpy") if NUMPY_AVAILABLE else ("python",)
+
+
+def environment() -> dict:
+    return {
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "numpy": np.__version__ if NUMPY_AVAILABLE else None,
+        "alphabet_size": len(ALPHABET),
+    }
+
+
+def write_report(name: str, results: list, output_dir: str = RESULTS_DIR) -> str:
+    """Raporu zaman damgalı dosyaya ve <name>_latest.json dosyasına yazar."""
+    os.makedirs(output_dir, exist_ok=True)
+    report = {
+        "benchmark": name,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "environment": environment(),
+        "results": results,
+    }
+    path = os.path.join(output_dir, f"{name}_{time.strftime('%Y%m%d-%H%M%S')}.json")
+    for target in (path, os.path.join(output_dir, f"{name}_latest.json")):
+        with open(target, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+    return path
+
+
+def baseline_path(name: str, output_dir: str = RESULTS_DIR) -> str:
+    return os.path.join(output_dir, f"{name}_baseline.json")
+
+
+def save_baseline(name: str, results: list, output_dir: str = RESULTS_DIR) -> str:
+    path = baseline_path(name, output_dir)
+    os.makedirs(output_dir, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({"benchmark": name, "environment": environment(), "results": results}, f, indent=2, ensure_ascii=False)
+    return path
+
+
+def find_regressions(name: str, results: list, metric: str, higher_is_better: bool = True,
+                     tolerance: float = DEFAULT_TOLERANCE, output_dir: str = RESULTS_DIR):
+    """
+    Sonuçları temel çizgiyle `case` alanına göre eşler. Tolerans dışında kötüleşen
+    durumları (case, temel değer, güncel değer) olarak döndürür.
+    """
+    path = baseline_path(name, output_dir)
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Temel çizgi bulunamadı: {path} (önce --save-baseline ile kaydedin)")
+    with open(path, encoding='utf-8') as f:
+        baseline = {row["case"]: row.get(metric) for row in json.load(f)["results"]}
+
+    regressions = []
+    for row in results:
+        expected = baseline.get(row["case"])
+        if expected is None:
+            continue
+        current = row[metric]
+        if higher_is_better:
+            regressed = current < expected * (1 - tolerance)
+        else:
+            regressed = current > expected * (1 + tolerance)
+        if regressed:
+            regressions.append((row["case"], expected, current))
+    return regressions
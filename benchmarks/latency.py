@@ -0,0 +1,139 @@
+import os
+import time
+from encryption_manager import EncryptionManager, MAX_MESSAGE_LENGTH
+from benchmarks.common import engines, make_text
+
+# 16 B .. 16 MB; en büyük boyut tek mesaj sınırına (2^24 - 1) kırpılır.
+SIZES = [16, 256, 4 * 1024, 64 * 1024, 1024 * 1024, MAX_MESSAGE_LENGTH]
+QUICK_SIZES = [16, 256, 4 * 1024, 64 * 1024]
+PERCENTILES = (50, 95, 99)
+TIME_BUDGET = 2.0
+MIN_SAMPLES = 5
+MAX_SAMPLES = 2000
+
+PHASES = ("header", "table", "chain", "join", "padding", "other")
+
+
+class PhaseTimedManager(EncryptionManager):
+    """
+    encrypt/decrypt akışını değiştirmeden aşamaların süresini ölçer. Süreler
+    dışlayıcıdır: iç içe çağrılar (ör. ters tablonun ileri tabloyu kurması,
+    NumPy motorunda zincirin içindeki join) üst aşamadan düşülür. Python
+    motorunda karakter birleştirme zincir döngüsünün içindedir ve "chain"
+    aşamasına sayılır. "other" = IV üretimi, son birleştirme ve çağrı yükü.
+    """
+    __slots__ = ("phases", "_stack")
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.reset()
+
+    def reset(self):
+        self.phases = dict.fromkeys(PHASES, 0.0)
+        self._stack = []
+
+    def _timed(self, phase, method, *args):
+        self._stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            return method(*args)
+        finally:
+            elapsed = time.perf_counter() - start
+            self.phases[phase] += elapsed - self._stack.pop()
+            if self._stack:
+                self._stack[-1] += elapsed
+
+    def _encode_header(self, *args):
+        return self._timed("header", super()._encode_header, *args)
+
+    def _decode_header(self, *args):
+        return self._timed("header", super()._decode_header, *args)
+
+    def _generate_transformation_table(self, *args):
+        return self._timed("table", super()._generate_transformation_table, *args)
+
+    def _generate_reverse_table(self, *args):
+        return self._timed("table", super()._generate_reverse_table, *args)
+
+    def _encrypt_chunk(self, *args):
+        return self._timed("chain", super()._encrypt_chunk, *args)
+
+    def _decrypt_chunk(self, *args):
+        return self._timed("chain", super()._decrypt_chunk, *args)
+
+    def _numpy_join(self, *args):
+        return self._timed("join", super()._numpy_join, *args)
+
+    def _padding(self):
+        return self._timed("padding", super()._padding)
+
+
+def percentile(sorted_values, p: float) -> float:
+    # En yakın sıra yöntemi; az örnekte de gözlenmiş bir değer döndürür.
+    index = max(0, min(len(sorted_values) - 1, -(-p * len(sorted_values) // 100) - 1))
+    return sorted_values[int(index)]
+
+
+def summarize(values) -> dict:
+    values = sorted(values)
+    summary = {f"p{p}": percentile(values, p) for p in PERCENTILES}
+    summary["mean"] = sum(values) / len(values)
+    return summary
+
+
+def sample(manager: PhaseTimedManager, func, arg):
+    manager.reset()
+    start = time.perf_counter()
+    func(arg)
+    total = time.perf_counter() - start
+    phases = manager.phases
+    phases["other"] = max(total - sum(phases.values()), 0.0)
+    return total, phases
+
+
+def measure(manager: PhaseTimedManager, func, arg, time_budget: float):
+    warmup, _ = sample(manager, func, arg)
+    count = int(min(MAX_SAMPLES, max(MIN_SAMPLES, time_budget / max(warmup, 1e-9))))
+    totals = []
+    phases = {phase: [] for phase in PHASES}
+    for _ in range(count):
+        total, timings = sample(manager, func, arg)
+        totals.append(total)
+        for phase, value in timings.items():
+            phases[phase].append(value)
+    return totals, phases
+
+
+def run(quick: bool = False, only=None):
+    results = []
+    key = os.urandom(32)
+    time_budget = TIME_BUDGET / 4 if quick else TIME_BUDGET
+    for engine in engines():
+        manager = PhaseTimedManager(key, engine=engine)
+        for size in (QUICK_SIZES if quick else SIZES):
+            text = make_text(size)
+            for operation, func, arg in (("encrypt", manager.encrypt, text),
+                                         ("decrypt", manager.decrypt, manager.encrypt(text))):
+                if only is not None and f"{operation}/{engine}/{size}" not in only:
+                    continue
+                totals, phases = measure(manager, func, arg, time_budget)
+                total = summarize(totals)
+                phase_summary = {phase: summarize(values) for phase, values in phases.items()}
+                results.append({
+                    "case": f"{operation}/{engine}/{size}",
+                    "operation": operation,
+                    "engine": engine,
+                    "size": size,
+                    "samples": len(totals),
+                    "total_s": total,
+                    "best_s": min(totals),
+                    "phases_s": phase_summary,
+                    "chars_per_sec": size / total["p50"],
+                })
+                shares = "  ".join(f"{phase}={phase_summary[phase]['p50'] / total['p50'] * 100:4.1f}%"
+                                   for phase in PHASES)
+                print(f"{operation}/{engine}/{size:<9} n={len(totals):<5} "
+                      f"p50={total['p50'] * 1e6:>11.1f} µs p95={total['p95'] * 1e6:>11.1f} µs "
+                      f"p99={total['p99'] * 1e6:>11.1f} µs  {size / total['p50'] / 1e6:>7.2f} M kar/s | {shares}",
+                      flush=True)
+    return results
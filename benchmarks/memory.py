@@ -0,0 +1,144 @@
+import os
+import sys
+import tempfile
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from encryption_manager import EncryptionManager, MAX_MESSAGE_LENGTH
+from container_format import decrypt_stream, encrypt_file, encrypt_stream
+from benchmarks.common import make_bytes, make_text
+
+try:
+    import resource
+    # ru_maxrss Linux'ta KB, macOS'ta bayt cinsindendir.
+    RSS_UNIT = 1 if sys.platform == "darwin" else 1024
+except ImportError:
+    resource = None
+
+KB = 1024
+MB = 1024 * KB
+# Tek mesaj yolları 16 MB sınırına kadar, daha büyük girdiler kapsayıcı akışıyla ölçülür.
+MESSAGE_SIZES = [KB, 64 * KB, MB, MAX_MESSAGE_LENGTH]
+STREAM_SIZES = [MB, 16 * MB, 100 * MB]
+QUICK_MESSAGE_SIZES = [KB, 64 * KB, MB]
+QUICK_STREAM_SIZES = [MB, 8 * MB]
+BLOCK_SIZE = 64 * KB
+
+
+def _proc_status(field: str):
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith(field + ":"):
+                return int(line.split()[1]) * 1024
+    return None
+
+
+def _reset_peak_rss():
+    """
+    Linux'ta tepe RSS (VmHWM) güncel RSS'e sıfırlanır ve güncel RSS döndürülür.
+    ru_maxrss exec sonrasında üst süreçten kalan tepe değeri taşıyabildiğinden
+    yalnızca /proc kullanılamadığında ona başvurulur.
+    """
+    try:
+        with open("/proc/self/clear_refs", 'w') as f:
+            f.write("5")
+        return _proc_status("VmRSS"), lambda: _proc_status("VmHWM")
+    except OSError:
+        if resource is None:
+            return None, lambda: None
+        peak = lambda: resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * RSS_UNIT
+        return peak(), peak
+
+
+def _write_repeated(path: str, block, size: int):
+    mode, kwargs = ('w', {"encoding": 'utf-8', "newline": ''}) if isinstance(block, str) else ('wb', {})
+    with open(path, mode, **kwargs) as f:
+        for start in range(0, size, len(block)):
+            f.write(block[:size - start])
+
+
+def _prepare(key: bytes, directory: str, message_sizes, stream_sizes):
+    """Girdi dosyalarını ölçüm süreçlerinin dışında hazırlar; durum listesini döndürür."""
+    manager = EncryptionManager(key)
+    text_block, byte_block = make_text(BLOCK_SIZE), make_bytes(BLOCK_SIZE)
+    cases = []
+    for size in message_sizes:
+        text_path = os.path.join(directory, f"text_{size}")
+        bytes_path = os.path.join(directory, f"bytes_{size}")
+        _write_repeated(text_path, text_block, size)
+        _write_repeated(bytes_path, byte_block, size)
+        with open(text_path, encoding='utf-8', newline='') as f:
+            cipher_text = manager.encrypt(f.read())
+        with open(text_path + ".enc", 'w', encoding='utf-8', newline='') as f:
+            f.write(cipher_text)
+        with open(bytes_path, 'rb') as f:
+            cipher_bytes = manager.encrypt_bytes(f.read())
+        with open(bytes_path + ".enc", 'wb') as f:
+            f.write(cipher_bytes)
+        del cipher_text, cipher_bytes
+        cases += [("encrypt", size, text_path), ("decrypt", size, text_path + ".enc"),
+                  ("encrypt_bytes", size, bytes_path), ("decrypt_bytes", size, bytes_path + ".enc")]
+    for size in stream_sizes:
+        stream_path = os.path.join(directory, f"stream_{size}")
+        _write_repeated(stream_path, byte_block, size)
+        encrypt_file(key, stream_path, stream_path + ".kilim", workers=1)
+        cases += [("encrypt_stream", size, stream_path), ("decrypt_stream", size, stream_path + ".kilim")]
+    return cases
+
+
+def _measure_case(key: bytes, operation: str, path: str):
+    # Her durum yeni bir süreçte ölçülür; RSS tepe değeri süreç boyunca yalnızca artar.
+    manager = EncryptionManager(key)
+    if operation.endswith("_stream"):
+        def run():
+            func = encrypt_stream if operation == "encrypt_stream" else decrypt_stream
+            with open(path, 'rb') as source, open(os.devnull, 'wb') as sink:
+                func(key, source, sink, workers=1)
+    else:
+        if operation in ("encrypt", "decrypt"):
+            with open(path, encoding='utf-8', newline='') as f:
+                data = f.read()
+        else:
+            with open(path, 'rb') as f:
+                data = f.read()
+        method = getattr(manager, operation)
+
+        def run():
+            method(data)
+
+    # RSS artışı, girdi yüklendikten sonraki RSS'e göre ölçülür.
+    rss_before, peak_rss = _reset_peak_rss()
+    run()
+    rss_after = peak_rss()
+
+    tracemalloc.start()
+    try:
+        run()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return peak, None if rss_before is None else max(rss_after - rss_before, 0)
+
+
+def run(quick: bool = False):
+    results = []
+    key = os.urandom(32)
+    message_sizes = QUICK_MESSAGE_SIZES if quick else MESSAGE_SIZES
+    stream_sizes = QUICK_STREAM_SIZES if quick else STREAM_SIZES
+    with tempfile.TemporaryDirectory(prefix="kilim-memory-") as directory:
+        for operation, size, path in _prepare(key, directory, message_sizes, stream_sizes):
+            with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as pool:
+                peak, rss_growth = pool.submit(_measure_case, key, operation, path).result()
+            results.append({
+                "case": f"{operation}/{size}",
+                "operation": operation,
+                "size": size,
+                "tracemalloc_peak": peak,
+                "peak_ratio": peak / size,
+                "rss_growth": rss_growth,
+                "rss_ratio": None if rss_growth is None else rss_growth / size,
+            })
+            rss = "-" if rss_growth is None else f"{rss_growth / MB:9.2f} MB"
+            print(f"{operation:<15} {size:>10} B  tracemalloc tepe={peak / MB:9.2f} MB "
+                  f"(x{peak / size:6.2f})  RSS artışı={rss}", flush=True)
+    return results
@@ -0,0 +1,55 @@
+import os
+import random
+import statistics
+import time
+from encryption_manager import EncryptionManager
+from benchmarks.common import TEXT_POOL
+
+MESSAGE_SIZES = [16, 64, 256]
+ITERATIONS = 5000
+QUICK_ITERATIONS = 500
+# Geçişler tüm durumlar üzerinden turlar halinde alınır (bkz. throughput.ROUNDS).
+ROUNDS = 3
+REPEATS_PER_ROUND = 3
+
+
+def time_per_message(func, items) -> float:
+    """Tüm öğeler üzerinden tek geçişin mesaj başına süresi (saniye)."""
+    start = time.perf_counter()
+    for item in items:
+        func(item)
+    return (time.perf_counter() - start) / len(items)
+
+
+def run(quick: bool = False, only=None):
+    iterations = QUICK_ITERATIONS if quick else ITERATIONS
+    cipher = EncryptionManager(os.urandom(32), engine="python")
+    rng = random.Random(0)
+
+    prepared = []
+    for size in MESSAGE_SIZES:
+        messages = ["".join(rng.choices(TEXT_POOL, k=size)) for _ in range(iterations)]
+        cipher_texts = [cipher.encrypt(m) for m in messages]
+        overhead = statistics.mean(len(c) - size for c in cipher_texts)
+        for operation, func, items in (("encrypt", cipher.encrypt, messages), ("decrypt", cipher.decrypt, cipher_texts)):
+            if only is None or f"{operation}/{size}" in only:
+                func(items[0])
+                prepared.append((f"{operation}/{size}", size, func, items, overhead, []))
+
+    for _ in range(ROUNDS):
+        for case, size, func, items, overhead, samples in prepared:
+            samples.extend(time_per_message(func, items) for _ in range(REPEATS_PER_ROUND))
+
+    results = []
+    for case, size, func, items, overhead, samples in prepared:
+        seconds = min(samples)
+        results.append({
+            "case": case,
+            "size": size,
+            "best_s": seconds,
+            "us_per_message": seconds * 1e6,
+            "ops_per_sec": 1 / seconds,
+            "overhead_chars": overhead,
+        })
+        print(f"{case:<16} {seconds * 1e6:>10.2f} µs/mesaj  ek yük {overhead:>5.1f} karakter", flush=True)
+    return results
@@ -0,0 +1,74 @@
+import os
+import statistics
+import time
+from encryption_manager import EncryptionManager
+from benchmarks.common import engines, make_bytes, make_text
+
+SIZES = [64, 1024, 16 * 1024, 256 * 1024, 1024 * 1024]
+QUICK_SIZES = [64, 1024, 64 * 1024]
+# Her durumun örnekleri tek seferde değil, tüm durumlar üzerinden ROUNDS tur
+# halinde alınır; birkaç saniyelik sistem yavaşlaması yalnızca bazı örnekleri etkiler.
+ROUNDS = 5
+REPEATS_PER_ROUND = 2
+MIN_RUN_TIME = 0.1
+
+
+def calibrate(func, arg, min_run_time: float = MIN_RUN_TIME) -> int:
+    """Isınmadan sonra tek örneğin en az `min_run_time` süreceği tekrar sayısı."""
+    func(arg)
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            func(arg)
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_run_time:
+            return loops
+        loops = max(loops * 2, int(loops * min_run_time / max(elapsed, 1e-9)))
+
+
+def sample(func, arg, loops: int) -> float:
+    start = time.perf_counter()
+    for _ in range(loops):
+        func(arg)
+    return (time.perf_counter() - start) / loops
+
+
+def cases(sizes):
+    key = os.urandom(32)
+    for engine in engines():
+        cipher = EncryptionManager(key, engine=engine)
+        for size in sizes:
+            text = make_text(size)
+            payload = make_bytes(size)
+            yield f"encrypt/{engine}/{size}", size, cipher.encrypt, text
+            yield f"decrypt/{engine}/{size}", size, cipher.decrypt, cipher.encrypt(text)
+            yield f"encrypt_bytes/{engine}/{size}", size, cipher.encrypt_bytes, payload
+            yield f"decrypt_bytes/{engine}/{size}", size, cipher.decrypt_bytes, cipher.encrypt_bytes(payload)
+
+
+def run(quick: bool = False, only=None):
+    min_run_time = MIN_RUN_TIME / 4 if quick else MIN_RUN_TIME
+    prepared = []
+    for case, size, func, arg in cases(QUICK_SIZES if quick else SIZES):
+        if only is None or case in only:
+            prepared.append((case, size, func, arg, calibrate(func, arg, min_run_time), []))
+
+    for _ in range(ROUNDS):
+        for case, size, func, arg, loops, samples in prepared:
+            samples.extend(sample(func, arg, loops) for _ in range(REPEATS_PER_ROUND))
+
+    results = []
+    for case, size, func, arg, loops, samples in prepared:
+        median = statistics.median(samples)
+        results.append({
+            "case": case,
+            "size": size,
+            "best_s": min(samples),
+            "median_s": median,
+            "ops_per_sec": 1 / median,
+            "chars_per_sec": size / median,
+        })
+        print(f"{case:<32} {min(samples) * 1e6:>12.1f} µs (en iyi)  {median * 1e6:>12.1f} µs (medyan)  "
+              f"{size / median / 1e6:>8.2f} M karakter/s", flush=True)
+    return results
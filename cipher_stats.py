@@ -0,0 +1,156 @@
+import os
+import threading
+import time
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from encryption_manager import IntegrityError, InvalidCharacterError
+
+# Log ölçekli kova sınırları: gecikme 1 µs .. ~8 s, boyut 1 .. 16M birim.
+LATENCY_BUCKETS = tuple(1e-6 * 2 ** k for k in range(24))
+SIZE_BUCKETS = tuple(2 ** k for k in range(25))
+
+ERROR_KINDS = ("hmac_failure", "invalid_character", "other")
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def error_kind(error: Exception) -> str:
+    if isinstance(error, IntegrityError):
+        return "hmac_failure"
+    if isinstance(error, InvalidCharacterError):
+        return "invalid_character"
+    return "other"
+
+
+class _OperationStats:
+    __slots__ = ("count", "units", "errors", "latency_counts", "latency_sum", "size_counts")
+
+    def __init__(self):
+        self.count = 0
+        self.units = 0
+        self.errors = dict.fromkeys(ERROR_KINDS, 0)
+        self.latency_counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.latency_sum = 0.0
+        self.size_counts = [0] * (len(SIZE_BUCKETS) + 1)
+
+
+class CipherStats:
+    """
+    EncryptionManager için isteğe bağlı ölçüm toplayıcı. Yönetici `stats`
+    verilmeden kurulduğunda hiçbir ölçüm yapılmaz. Aynı nesne birden çok
+    yönetici ve iş parçacığı arasında paylaşılabilir.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._operations = {}
+
+    def observe(self, operation: str, size: int, method, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            result = method(*args, **kwargs)
+        except Exception as e:
+            self._record(operation, size, time.perf_counter() - start, error_kind(e))
+            raise
+        self._record(operation, size, time.perf_counter() - start, None)
+        return result
+
+    def _record(self, operation: str, size: int, elapsed: float, error):
+        latency_bucket = bisect_left(LATENCY_BUCKETS, elapsed)
+        size_bucket = bisect_left(SIZE_BUCKETS, size)
+        with self._lock:
+            stats = self._operations.get(operation)
+            if stats is None:
+                stats = self._operations[operation] = _OperationStats()
+            stats.count += 1
+            stats.units += size
+            stats.latency_counts[latency_bucket] += 1
+            stats.latency_sum += elapsed
+            stats.size_counts[size_bucket] += 1
+            if error is not None:
+                stats.errors[error] += 1
+
+    def reset(self):
+        with self._lock:
+            self._operations.clear()
+
+    def snapshot(self) -> dict:
+        """İşlem adı -> sayaçlar ve kova sayıları (kümülatif olmayan) kopyası."""
+        with self._lock:
+            return {
+                operation: {
+                    "count": stats.count,
+                    "units": stats.units,
+                    "errors": dict(stats.errors),
+                    "latency_buckets": list(stats.latency_counts),
+                    "latency_sum": stats.latency_sum,
+                    "size_buckets": list(stats.size_counts),
+                }
+                for operation, stats in self._operations.items()
+            }
+
+    def to_prometheus(self, prefix: str = "kilim") -> str:
+        snapshot = self.snapshot()
+        lines = []
+
+        def header(name, kind, help_text):
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+
+        header("operations_total", "counter", "Completed and failed cipher operations.")
+        for operation, stats in snapshot.items():
+            lines.append(f'{prefix}_operations_total{{operation="{operation}"}} {stats["count"]}')
+
+        header("errors_total", "counter", "Failed cipher operations by kind.")
+        for operation, stats in snapshot.items():
+            for kind, count in stats["errors"].items():
+                lines.append(f'{prefix}_errors_total{{operation="{operation}",kind="{kind}"}} {count}')
+
+        header("units_total", "counter", "Input characters (str) or bytes processed.")
+        for operation, stats in snapshot.items():
+            lines.append(f'{prefix}_units_total{{operation="{operation}"}} {stats["units"]}')
+
+        def histogram(name, help_text, bounds, counts_key, sum_of):
+            header(name, "histogram", help_text)
+            for operation, stats in snapshot.items():
+                cumulative = 0
+                for bound, count in zip(bounds + (float("inf"),), stats[counts_key]):
+                    cumulative += count
+                    le = "+Inf" if bound == float("inf") else repr(bound)
+                    lines.append(f'{prefix}_{name}_bucket{{operation="{operation}",le="{le}"}} {cumulative}')
+                lines.append(f'{prefix}_{name}_sum{{operation="{operation}"}} {sum_of(stats)}')
+                lines.append(f'{prefix}_{name}_count{{operation="{operation}"}} {stats["count"]}')
+
+        histogram("operation_duration_seconds", "Cipher operation latency.", LATENCY_BUCKETS,
+                  "latency_buckets", lambda stats: stats["latency_sum"])
+        histogram("message_size_units", "Input size per operation.", SIZE_BUCKETS,
+                  "size_buckets", lambda stats: stats["units"])
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: str, prefix: str = "kilim"):
+        # node_exporter textfile toplayıcısı yarım dosya görmesin diye atomik yazılır.
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(self.to_prometheus(prefix))
+        os.replace(temp_path, path)
+
+    def serve_prometheus(self, port: int, address: str = "127.0.0.1", prefix: str = "kilim"):
+        """/metrics uç noktasını arka plan iş parçacığında sunar; sunucuyu döndürür."""
+        stats = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = stats.to_prometheus(prefix).encode('utf-8')
+                self.send_response(200)
+                self.send_header("Content-Type", PROMETHEUS_CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer((address, port), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server
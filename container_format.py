@@ -0,0 +1,179 @@
+import hmac
+import hashlib
+import os
+import secrets
+import struct
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from encryption_manager import EncryptionManager, IntegrityError, MAX_MESSAGE_LENGTH
+
+# Dosya düzeni:
+#   dosya başlığı : MAGIC (6) | sürüm (1) | parça boyutu (4) | dosya nonce'u (16)
+#   her parça     : uzunluk (4) | bayrak (1) | etiket (32) | encrypt_bytes çıktısı
+# Her parça, ana anahtardan dosya başlığı + parça sırası + son parça bayrağı ile
+# türetilen kendi anahtarıyla ve kendi IV'siyle şifrelenir. Böylece parçalar
+# bağımsız (paralel) işlenebilir. Etiket, aynı anahtarla parça başlığı + yük
+# üzerinden hesaplanan HMAC'tir; parça içeriğinin değiştirilmesi ya da kesilmesi,
+# parçaların yer değiştirmesi, kopyalanması ve sondan kesme doğrulamayı bozar.
+CONTAINER_MAGIC = b"KILIMC"
+CONTAINER_VERSION = 2
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+FILE_HEADER = struct.Struct(">6sBI16s")
+FRAME_HEADER = struct.Struct(">IB")
+FLAG_FINAL = 0x01
+TAG_SIZE = 32
+
+
+def derive_chunk_key(shared_key: bytes, file_header: bytes, index: int, final: bool) -> bytes:
+    label = b"KILIM-chunk" + file_header + index.to_bytes(8, 'big') + bytes([final])
+    return hmac.new(shared_key, label, hashlib.sha256).digest()
+
+
+def frame_tag(chunk_key: bytes, frame_header: bytes, payload) -> bytes:
+    mac = hmac.new(chunk_key, frame_header, hashlib.sha256)
+    mac.update(payload)
+    return mac.digest()
+
+
+def verify_frame(chunk_key: bytes, frame_header: bytes, tag: bytes, payload):
+    if not hmac.compare_digest(tag, frame_tag(chunk_key, frame_header, payload)):
+        raise IntegrityError("HMAC bütünlük doğrulama başarısız. Parça değiştirilmiş.")
+
+
+def _encrypt_frame(chunk_key: bytes, data: bytes, final: bool) -> bytes:
+    payload = EncryptionManager(chunk_key).encrypt_bytes(data)
+    frame_header = FRAME_HEADER.pack(len(payload), FLAG_FINAL if final else 0)
+    return frame_header + frame_tag(chunk_key, frame_header, payload) + payload
+
+
+def _decrypt_chunk(chunk_key: bytes, frame_header: bytes, tag: bytes, payload: bytes, expected_length) -> bytes:
+    verify_frame(chunk_key, frame_header, tag, payload)
+    data = EncryptionManager(chunk_key).decrypt_bytes(payload)
+    if expected_length is not None and len(data) != expected_length:
+        raise ValueError("Geçersiz parça uzunluğu, çözme başarısız.")
+    return data
+
+
+def _check_key(shared_key: bytes):
+    if len(shared_key) < 32:
+        raise ValueError("HMAC anahtarı en az 32 bayt olmalıdır.")
+
+
+def _read_exact(source, size: int) -> bytes:
+    parts = []
+    while size:
+        data = source.read(size)
+        if not data:
+            break
+        parts.append(data)
+        size -= len(data)
+    return b''.join(parts)
+
+
+def _run_ordered(func, tasks, workers):
+    """Görevleri sırayla sonuçlandırır; havuzda en fazla 2*workers parça bekler."""
+    tasks = iter(tasks)
+    first = next(tasks, None)
+    if first is None:
+        return
+    second = next(tasks, None)
+
+    if workers == 1 or second is None:
+        yield func(*first)
+        if second is not None:
+            yield func(*second)
+            for task in tasks:
+                yield func(*task)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        window = deque([pool.submit(func, *first), pool.submit(func, *second)])
+        for task in tasks:
+            window.append(pool.submit(func, *task))
+            if len(window) >= 2 * workers:
+                yield window.popleft().result()
+        while window:
+            yield window.popleft().result()
+
+
+def encrypt_stream(shared_key: bytes, source, sink, chunk_size: int = DEFAULT_CHUNK_SIZE, workers: int = None) -> int:
+    if not 0 < chunk_size <= MAX_MESSAGE_LENGTH:
+        raise ValueError(f"Parça boyutu 1 ile {MAX_MESSAGE_LENGTH} arasında olmalıdır.")
+    _check_key(shared_key)
+    workers = workers or os.cpu_count() or 1
+
+    file_header = FILE_HEADER.pack(CONTAINER_MAGIC, CONTAINER_VERSION, chunk_size, secrets.token_bytes(16))
+    sink.write(file_header)
+    written = len(file_header)
+
+    def tasks():
+        index = 0
+        data = _read_exact(source, chunk_size)
+        while True:
+            following = _read_exact(source, chunk_size) if len(data) == chunk_size else b''
+            final = not following
+            yield derive_chunk_key(shared_key, file_header, index, final), data, final
+            if final:
+                return
+            data = following
+            index += 1
+
+    for frame in _run_ordered(_encrypt_frame, tasks(), workers):
+        sink.write(frame)
+        written += len(frame)
+    return written
+
+
+def decrypt_stream(shared_key: bytes, source, sink, workers: int = None) -> int:
+    _check_key(shared_key)
+    workers = workers or os.cpu_count() or 1
+
+    file_header = _read_exact(source, FILE_HEADER.size)
+    if len(file_header) < FILE_HEADER.size:
+        raise ValueError("Kapsayıcı başlığı eksik, çözme başarısız.")
+    magic, version, chunk_size, _ = FILE_HEADER.unpack(file_header)
+    if magic != CONTAINER_MAGIC:
+        raise ValueError("Geçersiz kapsayıcı dosyası.")
+    if version != CONTAINER_VERSION:
+        raise ValueError(f"Desteklenmeyen kapsayıcı sürümü: {version}")
+    max_frame = EncryptionManager.encrypted_size_bound(chunk_size)
+
+    def tasks():
+        index = 0
+        while True:
+            frame_header = _read_exact(source, FRAME_HEADER.size)
+            if len(frame_header) < FRAME_HEADER.size:
+                raise ValueError("Kapsayıcı eksik: son parça bulunamadı.")
+            length, flags = FRAME_HEADER.unpack(frame_header)
+            if length > max_frame:
+                raise ValueError("Geçersiz parça uzunluğu, çözme başarısız.")
+            tag = _read_exact(source, TAG_SIZE)
+            payload = _read_exact(source, length)
+            if len(tag) < TAG_SIZE or len(payload) < length:
+                raise ValueError("Kapsayıcı eksik: parça kesilmiş.")
+            final = bool(flags & FLAG_FINAL)
+            # Son parça dışındaki tüm parçalar tam chunk_size bayt çözülmelidir.
+            chunk_key = derive_chunk_key(shared_key, file_header, index, final)
+            yield chunk_key, frame_header, tag, payload, None if final else chunk_size
+            if final:
+                if source.read(1):
+                    raise ValueError("Son parçadan sonra beklenmeyen veri.")
+                return
+            index += 1
+
+    written = 0
+    for data in _run_ordered(_decrypt_chunk, tasks(), workers):
+        sink.write(data)
+        written += len(data)
+    return written
+
+
+def encrypt_file(shared_key: bytes, source_path: str, target_path: str, chunk_size: int = DEFAULT_CHUNK_SIZE, workers: int = None) -> int:
+    with open(source_path, 'rb') as source, open(target_path, 'wb') as sink:
+        return encrypt_stream(shared_key, source, sink, chunk_size, workers)
+
+
+def decrypt_file(shared_key: bytes, source_path: str, target_path: str, workers: int = None) -> int:
+    with open(source_path, 'rb') as source, open(target_path, 'wb') as sink:
+        return decrypt_stream(shared_key, source, sink, workers)
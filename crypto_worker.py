@@ -0,0 +1,53 @@
+from PyQt5.QtCore import QObject, pyqtSignal
+from encryption_manager import EncryptionManager
+from stream_cipher import Encryptor, Decryptor
+
+# Arayüz iş parçacığına ilerleme bildirilen blok boyutu (karakter).
+BLOCK_SIZE = 1 << 16
+
+
+class CryptoWorker(QObject):
+    """
+    Şifreleme / çözme işini QThread üzerinde bloklar halinde yürütür. Bloklar
+    arasında ilerleme yayınlanır ve iptal isteği denetlenir.
+    """
+    progress = pyqtSignal(int)
+    # object: büyük sonuçlar iş parçacıkları arasında QString'e kopyalanmadan taşınır.
+    result = pyqtSignal(object)
+    error = pyqtSignal(str)
+    cancelled = pyqtSignal()
+    finished = pyqtSignal()
+
+    def __init__(self, manager: EncryptionManager, mode: str, text: str):
+        super().__init__()
+        self._manager = manager
+        self._mode = mode
+        self._text = text
+        self._cancel_requested = False
+
+    def cancel(self):
+        # Arayüz iş parçacığından doğrudan çağrılır; run() bir sonraki blokta durur.
+        self._cancel_requested = True
+
+    def run(self):
+        try:
+            context = Encryptor(self._manager, len(self._text)) if self._mode == "encrypt" else Decryptor(self._manager)
+            parts = []
+            total = len(self._text)
+            last_percent = -1
+            for start in range(0, total, BLOCK_SIZE):
+                if self._cancel_requested:
+                    self.cancelled.emit()
+                    return
+                parts.append(context.update(self._text[start:start + BLOCK_SIZE]))
+                percent = min(start + BLOCK_SIZE, total) * 100 // total
+                if percent != last_percent:
+                    self.progress.emit(percent)
+                    last_percent = percent
+            parts.append(context.finalize())
+            self.result.emit(''.join(parts))
+        except ValueError as e:
+            self.error.emit(str(e))
+        finally:
+            self._text = None
+            self.finished.emit()
@@ -1,6 +1,10 @@
+import argparse
+import json
 import os
 import secrets
 import random
+from collections import deque
+from multiprocessing import Pool
 from encryption_manager import EncryptionManager 
 
 MASTER_HMAC_KEY = secrets.token_bytes(32)  
@@ -12,6 +16,17 @@ FILE_SAME_CIPHER = "dataset_same_ciphertext.txt"
 FILE_VARIED_PLAIN = "dataset_varied_plaintext.txt"
 FILE_VARIED_CIPHER = "dataset_varied_ciphertext.txt"
 
+RECORD_SEPARATOR = " /////\n"
+
+# Hedef boyut bu büyüklükte parçalara bölünür; parçalar süreç havuzunda üretilip
+# sırayla, büyük tamponlu dosyalara yazılır.
+SHARD_BYTES = 4 * 1024 * 1024
+WRITE_BUFFER = 8 * 1024 * 1024
+CHECKPOINT_SUFFIX = ".checkpoint.json"
+# Her şifreli dosyanın anahtarı yanında tutulur; bir senaryonun yeniden
+# üretilmesi diğer senaryoların anahtarlarını değiştirmez.
+KEY_SUFFIX = ".key"
+
 
 TURKISH_SENTENCES = [
     
@@ -109,65 +124,215 @@ TURKISH_SENTENCES = [
 ]
 
 
-def generate_same_sentence_dataset(cipher_manager):
-    print(f"\n--- 1. Senaryo: Aynı Cümle (Repeated) Veri Seti Oluşturuluyor ---")
-    
-    sentence = "Bu, Türkçenin özel karakterlerini içeren ve frekans analizi direncini test eden sabit bir deneme cümlesidir.\n"
-    current_size = 0
-    
-    with open(FILE_SAME_PLAIN, 'w', encoding='utf-8') as fp, \
-         open(FILE_SAME_CIPHER, 'w', encoding='utf-8') as fc:
-        
-        while current_size < TARGET_BYTES:
-            fp.write(sentence)
-            
-            encrypted_text = cipher_manager.encrypt(sentence)
-            
-            fc.write(encrypted_text + " /////\n")
-            
-            current_size += len(sentence.encode('utf-8'))
-            
-            if current_size % (1024 * 1024) == 0: 
-                 print(f"  -> {current_size / (1024*1024):.1f} MB işlendi...")
-
-    print(f"✅ Tamamlandı: {FILE_SAME_PLAIN} ve {FILE_SAME_CIPHER} oluşturuldu.")
-
-
-def generate_varied_sentence_dataset(cipher_manager):
-    print(f"\n--- 2. Senaryo: Farklı Cümleler (Varied) Veri Seti Oluşturuluyor ---")
-    
-    current_size = 0
-    
-    with open(FILE_VARIED_PLAIN, 'w', encoding='utf-8') as fp, \
-         open(FILE_VARIED_CIPHER, 'w', encoding='utf-8') as fc:
-        
-        while current_size < TARGET_BYTES:
-            sentence = random.choice(TURKISH_SENTENCES) + "\n"
-            fp.write(sentence)
-            
-            encrypted_text = cipher_manager.encrypt(sentence)
-            
-            fc.write(encrypted_text + " /////\n")
-            
-            current_size += len(sentence.encode('utf-8'))
-            
-            if current_size % (2 * 1024 * 1024) < 200: 
-                 print(f"  -> {current_size / (1024*1024):.1f} MB işlendi...")
-
-    print(f"✅ Tamamlandı: {FILE_VARIED_PLAIN} ve {FILE_VARIED_CIPHER} oluşturuldu.")
+SAME_SENTENCE = "Bu, Türkçenin özel karakterlerini içeren ve frekans analizi direncini test eden sabit bir deneme cümlesidir.\n"
+
+SCENARIOS = {
+    "same": ("1. Senaryo: Aynı Cümle (Repeated)", FILE_SAME_PLAIN, FILE_SAME_CIPHER),
+    "varied": ("2. Senaryo: Farklı Cümleler (Varied)", FILE_VARIED_PLAIN, FILE_VARIED_CIPHER),
+}
+
+
+_worker_manager = None
+
+
+def _init_worker(shared_key: bytes):
+    global _worker_manager
+    _worker_manager = EncryptionManager(shared_key)
+
+
+def _generate_shard(scenario: str, target_bytes: int, seed: int):
+    """Bir parçanın düz ve şifreli metnini üretir: (düz, şifreli, düz metin baytı, kayıt)."""
+    rng = random.Random(seed)
+    plain_parts = []
+    cipher_parts = []
+    size = 0
+    while size < target_bytes:
+        sentence = SAME_SENTENCE if scenario == "same" else rng.choice(TURKISH_SENTENCES) + "\n"
+        plain_parts.append(sentence)
+        cipher_parts.append(_worker_manager.encrypt(sentence))
+        cipher_parts.append(RECORD_SEPARATOR)
+        size += len(sentence.encode('utf-8'))
+    return ''.join(plain_parts), ''.join(cipher_parts), size, len(plain_parts)
+
+
+def _run_shard(task):
+    return _generate_shard(*task)
+
+
+def _load_checkpoint(path: str):
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding='utf-8') as f:
+        checkpoint = json.load(f)
+    version, internal, gauss = checkpoint["rng_state"]
+    checkpoint["rng_state"] = (version, tuple(internal), gauss)
+    return checkpoint
+
+
+def _save_checkpoint(path: str, checkpoint: dict):
+    # Yarım yazılmış kontrol noktası görülmemesi için geçici dosya + os.replace.
+    temp_path = path + ".tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(checkpoint, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+
+
+def _load_key(path: str) -> bytes:
+    if not os.path.exists(path):
+        raise ValueError(f"Anahtar dosyası bulunamadı: {path}. Şifreli dosya başka anahtarla sürdürülemez.")
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def _save_key(path: str, shared_key: bytes):
+    temp_path = path + ".tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(shared_key)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+
+
+def _truncate(path: str, size: int):
+    with open(path, 'ab') as f:
+        if f.tell() < size:
+            raise ValueError(f"{path} kontrol noktasındaki boyuttan kısa, devam edilemez.")
+        f.truncate(size)
+
+
+def generate_dataset(scenario: str, shared_key: bytes = None, target_bytes: int = TARGET_BYTES,
+                     workers: int = None, output_dir: str = ".", seed: int = None, resume: bool = False):
+    """
+    Parçaları süreç havuzunda üretir ve sırayla yazar. Cümle seçimi `seed` ile
+    tekrarlanabilir; her parçadan sonra dosya konumları, RNG durumu ve kayıt
+    sayısı kontrol noktasına yazılır. `resume` ile son tamamlanan parçadan,
+    dosyalar o konumlara kırpılarak ve kayıtlı anahtarla devam edilir.
+    Anahtar şifreli dosyanın yanına `<dosya>.key` olarak yazılır; `shared_key`
+    verilmezse yeni bir anahtar üretilir.
+    """
+    title, plain_name, cipher_name = SCENARIOS[scenario]
+    plain_path = os.path.join(output_dir, plain_name)
+    cipher_path = os.path.join(output_dir, cipher_name)
+    checkpoint_path = cipher_path + CHECKPOINT_SUFFIX
+    key_path = cipher_path + KEY_SUFFIX
+    print(f"\n--- {title} Veri Seti Oluşturuluyor ---")
+
+    checkpoint = _load_checkpoint(checkpoint_path) if resume else None
+    if checkpoint is not None:
+        if checkpoint["target_bytes"] != target_bytes or checkpoint["shard_bytes"] != SHARD_BYTES:
+            raise ValueError("Kontrol noktası farklı bir hedef boyut veya parça boyutu ile oluşturulmuş.")
+        saved_key = _load_key(key_path)
+        if shared_key is not None and shared_key != saved_key:
+            raise ValueError(f"Verilen anahtar {key_path} ile eşleşmiyor, devam edilemez.")
+        shared_key = saved_key
+        if checkpoint["complete"]:
+            print(f"✅ Zaten tamamlanmış: {plain_path} ve {cipher_path}")
+            return
+        _truncate(plain_path, checkpoint["plain_offset"])
+        _truncate(cipher_path, checkpoint["cipher_offset"])
+        rng = random.Random()
+        rng.setstate(checkpoint["rng_state"])
+        mode = 'a'
+        print(f"  -> {checkpoint['plain_bytes'] / (1024*1024):.1f} MB'tan devam ediliyor "
+              f"({checkpoint['records']} kayıt).")
+    else:
+        if seed is None:
+            seed = secrets.randbits(64)
+        rng = random.Random(seed)
+        if shared_key is None:
+            shared_key = secrets.token_bytes(32)
+        _save_key(key_path, shared_key)
+        checkpoint = {
+            "scenario": scenario, "seed": seed, "target_bytes": target_bytes, "shard_bytes": SHARD_BYTES,
+            "shards": 0, "records": 0, "plain_bytes": 0, "plain_offset": 0, "cipher_offset": 0,
+            "rng_state": rng.getstate(), "complete": False,
+        }
+        mode = 'w'
+    _save_checkpoint(checkpoint_path, checkpoint)
+
+    # Havuz görevleri önden tüketir; her parçanın tohumundan sonraki RNG durumu
+    # sonucu yazılana kadar sırayla bekletilir.
+    pending_states = deque()
+
+    def shard_tasks():
+        for start in range(checkpoint["shards"] * SHARD_BYTES, target_bytes, SHARD_BYTES):
+            shard_seed = rng.getrandbits(64)
+            pending_states.append(rng.getstate())
+            yield scenario, min(SHARD_BYTES, target_bytes - start), shard_seed
+
+    next_report = (checkpoint["plain_bytes"] // (1024 * 1024) + 1) * 1024 * 1024
+    # İkili kip: tell() kesin bayt konumunu verir, şifreli metindeki '\n' aynen yazılır.
+    with open(plain_path, mode + 'b', buffering=WRITE_BUFFER) as fp, \
+         open(cipher_path, mode + 'b', buffering=WRITE_BUFFER) as fc, \
+         Pool(workers or os.cpu_count() or 1, initializer=_init_worker, initargs=(shared_key,)) as pool:
+
+        for plain_text, cipher_text, size, records in pool.imap(_run_shard, shard_tasks()):
+            fp.write(plain_text.encode('utf-8'))
+            fc.write(cipher_text.encode('utf-8'))
+            # Kontrol noktası yalnızca parça diske ulaştıktan sonra ilerletilir.
+            for f in (fp, fc):
+                f.flush()
+                os.fsync(f.fileno())
+
+            checkpoint["shards"] += 1
+            checkpoint["records"] += records
+            checkpoint["plain_bytes"] += size
+            checkpoint["plain_offset"] = fp.tell()
+            checkpoint["cipher_offset"] = fc.tell()
+            checkpoint["rng_state"] = pending_states.popleft()
+            _save_checkpoint(checkpoint_path, checkpoint)
+
+            if checkpoint["plain_bytes"] >= next_report:
+                print(f"  -> {checkpoint['plain_bytes'] / (1024*1024):.1f} MB işlendi...")
+                next_report = (checkpoint["plain_bytes"] // (1024 * 1024) + 1) * 1024 * 1024
+
+    checkpoint["complete"] = True
+    _save_checkpoint(checkpoint_path, checkpoint)
+    print(f"✅ Tamamlandı: {plain_path} ve {cipher_path} oluşturuldu (tohum: {checkpoint['seed']}, anahtar: {key_path}).")
+
+
+def generate_same_sentence_dataset(cipher_manager, target_bytes: int = TARGET_BYTES, workers: int = None,
+                                   seed: int = None, resume: bool = False):
+    generate_dataset("same", cipher_manager.hmac_key, target_bytes, workers, seed=seed, resume=resume)
+
+
+def generate_varied_sentence_dataset(cipher_manager, target_bytes: int = TARGET_BYTES, workers: int = None,
+                                     seed: int = None, resume: bool = False):
+    generate_dataset("varied", cipher_manager.hmac_key, target_bytes, workers, seed=seed, resume=resume)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="KILIM düz/şifreli metin veri seti üreticisi")
+    parser.add_argument("--size-mb", type=float, default=TARGET_SIZE_MB,
+                        help="her senaryo için hedef düz metin boyutu, MB (varsayılan: %(default)s)")
+    parser.add_argument("--scenarios", nargs="+", choices=sorted(SCENARIOS), default=["same", "varied"])
+    parser.add_argument("--workers", type=int, default=None, help="işçi süreç sayısı (varsayılan: çekirdek sayısı)")
+    parser.add_argument("--output-dir", default=".")
+    parser.add_argument("--seed", type=int, default=None, help="cümle seçimi için tohum (tekrarlanabilir üretim)")
+    parser.add_argument("--resume", action="store_true",
+                        help="kontrol noktasından ve <şifreli dosya>.key anahtarıyla kaldığı yerden devam eder")
+    args = parser.parse_args()
+
+    target_bytes = int(args.size_mb * 1024 * 1024)
+    os.makedirs(args.output_dir, exist_ok=True)
+    # Devam ederken her senaryo kendi kayıtlı anahtarını kullanır; kontrol noktası
+    # olmayan senaryolar yeni anahtarla baştan başlar.
+    shared_key = None if args.resume else MASTER_HMAC_KEY
+    print(f"Hedef Boyut: {args.size_mb} MB (Her dosya için)")
+    print(f"Cümle Havuzu Boyutu: {len(TURKISH_SENTENCES)} farklı cümle.")
+
+    for scenario in args.scenarios:
+        generate_dataset(scenario, shared_key, target_bytes, args.workers, args.output_dir, args.seed, args.resume)
+
+    print("\nTüm işlemler başarıyla bitirildi.")
 
 
 if __name__ == "__main__":
     try:
-        manager = EncryptionManager(MASTER_HMAC_KEY)
-        print(f"Hedef Boyut: {TARGET_SIZE_MB} MB (Her dosya için)")
-        print(f"Cümle Havuzu Boyutu: {len(TURKISH_SENTENCES)} farklı cümle.")
-        
-        generate_same_sentence_dataset(manager)
-
-        generate_varied_sentence_dataset(manager)
-        
-        print("\nTüm işlemler başarıyla bitirildi.")
-        
+        main()
+    except KeyboardInterrupt:
+        print("\nKesildi. Kaldığı yerden sürdürmek için --resume ile yeniden çalıştırın.")
     except Exception as e:
-        print(f"Bir hata oluştu: {e}")
\ No newline at end of file
+        print(f"Bir hata oluştu: {e}")
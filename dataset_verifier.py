@@ -0,0 +1,146 @@
+import argparse
+import mmap
+import multiprocessing
+import os
+import sys
+import time
+from typing import NamedTuple
+from encryption_manager import EncryptionManager
+from dataset_generator import KEY_SUFFIX, RECORD_SEPARATOR
+
+SEPARATOR_BYTES = RECORD_SEPARATOR.encode('utf-8')
+DEFAULT_BATCH_SIZE = 2000
+
+
+class VerificationReport(NamedTuple):
+    total: int
+    verified: int
+    failures: list
+    elapsed: float
+
+    @property
+    def ok(self) -> bool:
+        return not self.failures
+
+
+def iter_record_spans(buffer):
+    """Ayraçla biten kayıtların (başlangıç, bitiş) bayt aralıklarını verir."""
+    start = 0
+    find = buffer.find
+    while True:
+        end = find(SEPARATOR_BYTES, start)
+        if end < 0:
+            break
+        yield start, end
+        start = end + len(SEPARATOR_BYTES)
+    if start < len(buffer):
+        # Ayraçsız son kayıt: yarım yazılmış dosya; yine de doğrulamaya gönderilir.
+        yield start, len(buffer)
+
+
+def _batched_spans(buffer, batch_size: int):
+    batch = []
+    for index, (start, end) in enumerate(iter_record_spans(buffer)):
+        batch.append((index, start, end))
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+_worker_state = None
+
+
+def _init_worker(shared_key: bytes, cipher_path: str):
+    global _worker_state
+    # Her işçi dosyayı kendisi eşler; görevler yalnızca bayt aralıkları taşır.
+    with open(cipher_path, 'rb') as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if os.path.getsize(cipher_path) else b''
+    _worker_state = (EncryptionManager(shared_key), mapped)
+
+
+def _verify_batch(batch):
+    manager, mapped = _worker_state
+    results = []
+    for index, start, end in batch:
+        try:
+            plain_text = manager.decrypt(mapped[start:end].decode('utf-8'))
+            results.append((index, start, plain_text, None))
+        except ValueError as e:
+            results.append((index, start, None, str(e)))
+    return results
+
+
+def verify_dataset(shared_key: bytes, cipher_path: str, output_path: str = None,
+                   report_path: str = None, workers: int = None,
+                   batch_size: int = DEFAULT_BATCH_SIZE) -> VerificationReport:
+    """
+    Bir şifreli veri seti dosyasındaki kayıtları süreç havuzunda HMAC
+    doğrulamasından geçirip çözer. Çözülen metinler kayıt sırasıyla
+    `output_path` dosyasına, hatalar `report_path` dosyasına yazılır.
+    """
+    start_time = time.perf_counter()
+    workers = workers or os.cpu_count() or 1
+    total = verified = 0
+    failures = []
+
+    output = open(output_path, 'w', encoding='utf-8', newline='', buffering=1 << 20) if output_path else None
+    try:
+        with open(cipher_path, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if os.path.getsize(cipher_path) else b''
+        try:
+            with multiprocessing.Pool(workers, initializer=_init_worker, initargs=(shared_key, cipher_path)) as pool:
+                for results in pool.imap(_verify_batch, _batched_spans(mapped, batch_size)):
+                    for index, offset, plain_text, error in results:
+                        total += 1
+                        if error is None:
+                            verified += 1
+                            if output:
+                                output.write(plain_text)
+                        else:
+                            failures.append((index, offset, error))
+        finally:
+            if isinstance(mapped, mmap.mmap):
+                mapped.close()
+    finally:
+        if output:
+            output.close()
+
+    if report_path:
+        with open(report_path, 'w', encoding='utf-8') as report:
+            report.write("index\toffset\terror\n")
+            for index, offset, error in failures:
+                report.write(f"{index}\t{offset}\t{error}\n")
+
+    return VerificationReport(total, verified, failures, time.perf_counter() - start_time)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="KILIM şifreli veri seti doğrulayıcı")
+    parser.add_argument("cipher_file", help="' /////' ayraçlı şifreli veri seti dosyası")
+    parser.add_argument("--key-file", help=f"ham anahtar dosyası (varsayılan: <cipher_file>{KEY_SUFFIX})")
+    parser.add_argument("--key-hex", help="onaltılık anahtar (--key-file yerine)")
+    parser.add_argument("--output", help="çözülen metinlerin yazılacağı dosya")
+    parser.add_argument("--report", help="hatalı kayıtların yazılacağı rapor dosyası")
+    parser.add_argument("--workers", type=int, default=None, help="işçi süreç sayısı (varsayılan: çekirdek sayısı)")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    args = parser.parse_args()
+
+    if args.key_hex:
+        key = bytes.fromhex(args.key_hex)
+    else:
+        with open(args.key_file or args.cipher_file + KEY_SUFFIX, 'rb') as fk:
+            key = fk.read()
+
+    report = verify_dataset(key, args.cipher_file, args.output, args.report, args.workers, args.batch_size)
+    size_mb = os.path.getsize(args.cipher_file) / (1024 * 1024)
+    print(f"Kayıt: {report.total} | Doğrulanan: {report.verified} | Hatalı: {len(report.failures)}")
+    print(f"Süre: {report.elapsed:.2f} s ({size_mb / max(report.elapsed, 1e-9):.2f} MB/s)")
+    for index, offset, error in report.failures[:10]:
+        print(f"  #{index} (bayt {offset}): {error}")
+    sys.exit(0 if report.ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+import io
+import mmap
+from encryption_manager import EncryptionManager, HEADER_BYTES, MAX_HEADER_BYTES, SUITE_V1
+from container_format import (CONTAINER_MAGIC, CONTAINER_VERSION, FILE_HEADER, FRAME_HEADER, FLAG_FINAL,
+                              TAG_SIZE, derive_chunk_key, verify_frame)
+
+
+class _Segment:
+    """Doğrulanmış tek bir encrypt_bytes mesajının gövdesi ve çözme tablosu."""
+    __slots__ = ("manager", "body", "inverse", "initial_prev")
+
+    def __init__(self, manager: EncryptionManager, view, offset: int, length: int):
+        if length < HEADER_BYTES[SUITE_V1]:
+            raise ValueError("Şifreli veri başlıktan kısa, çözme başarısız.")
+        # Gövde dilimi yalnızca doğrulamadan sonra alınır; hata durumunda eşlemeye
+        # bağlı dilim kalmaz ve dosya kapatılabilir.
+        suite, iv_bytes, msg_length = manager._verify_header(bytes(view[offset:offset + min(length, MAX_HEADER_BYTES)]))
+        body_start = offset + HEADER_BYTES[suite]
+        if length < HEADER_BYTES[suite] + msg_length:
+            raise ValueError("Şifreli veri eksik, çözme başarısız.")
+        self.manager = manager
+        self.body = view[body_start:body_start + msg_length]
+        self.inverse = manager._generate_reverse_table(iv_bytes, suite)
+        self.initial_prev = manager._initial_state(iv_bytes)
+
+    def decrypt(self, start: int, out) -> int:
+        # Çözmede prev, bir önceki şifreli indeksin ters tablodaki karşılığıdır;
+        # bu yüzden herhangi bir konum yalnızca sol komşusuyla çözülebilir.
+        prev = self.initial_prev if start == 0 else self.inverse[self.body[start - 1]]
+        data = self.body[start:start + len(out)]
+        self.manager._decrypt_byte_chunk(data, self.inverse, prev, out)
+        return len(data)
+
+
+class EncryptedFileReader(io.RawIOBase):
+    """
+    encrypt_bytes çıktısı ya da kapsayıcı (container_format) dosyası için
+    salt okunur, konumlanabilir akış. Dosya mmap ile eşlenir; read() yalnızca
+    istenen aralığı çözer. Kapsayıcıda her parça ilk erişimde etiketiyle doğrulanır.
+    """
+    def __init__(self, shared_key: bytes, path: str, engine: str = "auto"):
+        super().__init__()
+        self._shared_key = shared_key
+        self._engine = engine
+        self._position = 0
+        self._file = open(path, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Boş dosya eşlenemez.
+            self._file.close()
+            raise ValueError("Şifreli veri başlıktan kısa, çözme başarısız.")
+        self._view = memoryview(self._map)
+
+        try:
+            if self._map[:len(CONTAINER_MAGIC)] == CONTAINER_MAGIC:
+                self._open_container()
+            else:
+                self._chunk_size = None
+                self._current = (0, _Segment(EncryptionManager(shared_key, engine), self._view, 0, len(self._view)))
+                self._length = len(self._current[1].body)
+        except BaseException:
+            self.close()
+            raise
+
+    def _open_container(self):
+        if len(self._map) < FILE_HEADER.size:
+            raise ValueError("Kapsayıcı başlığı eksik, çözme başarısız.")
+        self._file_header = bytes(self._map[:FILE_HEADER.size])
+        _, version, chunk_size, _ = FILE_HEADER.unpack(self._file_header)
+        if version != CONTAINER_VERSION:
+            raise ValueError(f"Desteklenmeyen kapsayıcı sürümü: {version}")
+        self._chunk_size = chunk_size
+
+        # Yalnızca 5 baytlık parça başlıkları okunur; yükler ilk erişimde doğrulanır.
+        frames = []
+        offset = FILE_HEADER.size
+        final = False
+        while not final:
+            if offset + FRAME_HEADER.size > len(self._map):
+                raise ValueError("Kapsayıcı eksik: son parça bulunamadı.")
+            length, flags = FRAME_HEADER.unpack_from(self._map, offset)
+            if offset + FRAME_HEADER.size + TAG_SIZE + length > len(self._map):
+                raise ValueError("Kapsayıcı eksik: parça kesilmiş.")
+            final = bool(flags & FLAG_FINAL)
+            frames.append((offset, length, final))
+            offset += FRAME_HEADER.size + TAG_SIZE + length
+        if offset != len(self._map):
+            raise ValueError("Son parçadan sonra beklenmeyen veri.")
+        self._frames = frames
+        self._current = None
+
+        # Son parça dışındaki tüm parçalar tam chunk_size uzunluğundadır.
+        self._length = (len(frames) - 1) * chunk_size + len(self._segment(len(frames) - 1).body)
+
+    def _segment(self, index: int) -> _Segment:
+        if self._current is None or self._current[0] != index:
+            offset, length, final = self._frames[index]
+            chunk_key = derive_chunk_key(self._shared_key, self._file_header, index, final)
+            frame_header = self._map[offset:offset + FRAME_HEADER.size]
+            offset += FRAME_HEADER.size
+            tag = self._map[offset:offset + TAG_SIZE]
+            offset += TAG_SIZE
+            # Dilim hata durumunda da bırakılır ki eşleme kapatılabilsin.
+            with self._view[offset:offset + length] as payload:
+                verify_frame(chunk_key, frame_header, tag, payload)
+            segment = _Segment(EncryptionManager(chunk_key, self._engine), self._view, offset, length)
+            if not final and len(segment.body) != self._chunk_size:
+                segment.body.release()
+                raise ValueError("Geçersiz parça uzunluğu, çözme başarısız.")
+            self._current = (index, segment)
+        return self._current[1]
+
+    def __len__(self):
+        return self._length
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        self._checkClosed()
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        self._checkClosed()
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self._length + offset
+        else:
+            raise ValueError(f"Geçersiz whence değeri: {whence}")
+        if position < 0:
+            raise ValueError("Negatif konuma gidilemez.")
+        self._position = position
+        return position
+
+    def readinto(self, buffer) -> int:
+        self._checkClosed()
+        out = memoryview(buffer).cast('B')
+        size = min(len(out), max(self._length - self._position, 0))
+        written = 0
+        while written < size:
+            position = self._position + written
+            if self._chunk_size is None:
+                segment, start = self._current[1], position
+            else:
+                index, start = divmod(position, self._chunk_size)
+                segment = self._segment(index)
+            written += segment.decrypt(start, out[written:size])
+        self._position += written
+        return written
+
+    def close(self):
+        if not self.closed and hasattr(self, "_file"):
+            self._current = None
+            if hasattr(self, "_view"):
+                self._view.release()
+                self._map.close()
+            self._file.close()
+        super().close()
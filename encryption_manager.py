@@ -1,119 +1,593 @@
-
 import secrets
 import hmac
 import hashlib
 import base64
+import binascii
+import codecs
+import inspect
 import random
+import struct
+from array import array
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import wraps
+from itertools import islice
+from types import MappingProxyType
+from typing import NamedTuple, Optional
 from unicodedata import normalize
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+ENGINES = ("auto", "python", "numpy")
+# "auto" modunda NumPy motoru bu uzunluktan itibaren devreye girer; daha kısa
+# mesajlarda dizi kurulum maliyeti karakter döngüsünden pahalıdır.
+NUMPY_MIN_LENGTH = 512
+
+# Şifre takımları. v1: HMAC'in ilk 8 baytıyla tohumlanan Mersenne Twister
+# karıştırması, başlık = HMAC | IV | uzunluk. v2: HMAC anahtarlı SHAKE-256
+# akışı üzerinde Fisher–Yates, başlık = sürüm | HMAC | IV | uzunluk.
+SUITE_V1 = 1
+SUITE_V2 = 2
+SUITES = (SUITE_V1, SUITE_V2)
+DEFAULT_SUITE = SUITE_V2
+
+HEADER_BYTES = {SUITE_V1: 32 + 4 + 3, SUITE_V2: 1 + 32 + 4 + 3}
+ENCODED_HEADER_LENGTH = {suite: (size * 4 + 2) // 3 for suite, size in HEADER_BYTES.items()}
+MAX_HEADER_BYTES = max(HEADER_BYTES.values())
+MAX_ENCODED_HEADER_LENGTH = max(ENCODED_HEADER_LENGTH.values())
+MAX_MESSAGE_LENGTH = (1 << 24) - 1
+MIN_PADDING = 50
+MAX_PADDING = 99
+
+_URLSAFE_B64 = bytes.maketrans(b'+/', b'-_')
+
+EXECUTORS = ("thread", "process")
+DEFAULT_BATCH_SIZE = 256
+# Tek mesajın süreç havuzunda bölünmesi ancak bu uzunluktan sonra kârlıdır.
+PARALLEL_MIN_LENGTH = 1 << 16
+
+
+class IntegrityError(ValueError):
+    """HMAC doğrulaması başarısız: şifreli veri değiştirilmiş ya da anahtar yanlış."""
+
+
+class InvalidCharacterError(ValueError):
+    """Girdide alfabe dışı bir karakter var."""
+
+
+class BatchResult(NamedTuple):
+    value: Optional[str]
+    error: Optional[Exception]
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _run_batch(operation, batch):
+    results = []
+    for item in batch:
+        try:
+            results.append(BatchResult(operation(item), None))
+        except (ValueError, TypeError) as e:
+            results.append(BatchResult(None, e))
+    return results
+
+
+def _single_character(char: str) -> str:
+    # NFKC bazı Latin-1 karakterlerini birden çok kod noktasına açar ('½' -> '1⁄2').
+    # Şifreli metin karakter karakter okunduğundan bunlar özgün halleriyle tutulur.
+    normalized = normalize('NFKC', char)
+    return normalized if len(normalized) == 1 else char
+
+
+# Alfabe içe aktarma sırasında bir kez kurulur ve kod noktasına göre sıralanır.
+# Küme sırası karma rastgeleleştirmesine bağlı olduğundan sıralama, farklı
+# süreçlerdeki yöneticilerin aynı indeksleri kullanmasını sağlar.
+TURKISH_CHARACTERS = ("ç", "ğ", "ı", "İ", "ö", "ş", "ü", "Ç", "Ğ", "I", "Ö", "Ş", "Ü")
+ALPHABET = tuple(sorted(
+    {_single_character(chr(i)) for i in range(256)}.union(
+        _single_character(c) for c in TURKISH_CHARACTERS)
+))
+ALPHABET_SIZE = len(ALPHABET)
+_CHAR_TO_INDEX = {char: idx for idx, char in enumerate(ALPHABET)}
+CHAR_TO_INDEX = MappingProxyType(_CHAR_TO_INDEX)
+# Dolgu için rastgele bayt -> karakter eşlemesi (n == 256 iken düzgün dağılımlı).
+_BYTE_TO_CHAR = tuple(ALPHABET[b % ALPHABET_SIZE] for b in range(256))
+
+_numpy_tables = None
+
+
+def _get_numpy_tables():
+    global _numpy_tables
+    if _numpy_tables is None:
+        # Kod noktası -> alfabe indeksi; son eleman alfabe dışı karakterler için -1.
+        lut = np.full(ord(ALPHABET[-1]) + 2, -1, dtype=np.int16)
+        codepoints = np.array([ord(c) for c in ALPHABET], dtype='<u4')
+        lut[codepoints] = np.arange(ALPHABET_SIZE)
+        _numpy_tables = (lut, codepoints)
+    return _numpy_tables
+
+
+_worker_manager = None
+
+
+def _init_batch_worker(shared_key: bytes, engine: str, suite: int):
+    global _worker_manager
+    _worker_manager = EncryptionManager(shared_key, engine, suite)
+
+
+def _process_batch(operation_name: str, batch):
+    return _run_batch(getattr(_worker_manager, operation_name), batch)
+
+
+def _prefix_indices(text: str) -> bytes:
+    # prev = 0 ile yerel önek toplamları (mod n); n == 256 olduğundan her biri bir bayttır.
+    char_to_index = _CHAR_TO_INDEX
+    n = ALPHABET_SIZE
+    prefix = bytearray()
+    append = prefix.append
+    prev = 0
+    try:
+        for char in text:
+            prev = (char_to_index[char] + prev) % n
+            append(prev)
+    except KeyError as e:
+        raise InvalidCharacterError(f"Geçersiz karakter: {e.args[0]}")
+    return bytes(prefix)
+
+
+def _instrumented(operation: str):
+    # `stats` verilmemişse yalnızca tek bir öznitelik denetimi yapılır.
+    def decorator(method):
+        # Girdi anahtar sözcükle de verilebilir (ör. `decrypt(cipher_text=...)`).
+        data_name = list(inspect.signature(method).parameters)[1]
+
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            stats = self.stats
+            if stats is None:
+                return method(self, *args, **kwargs)
+            data = args[0] if args else kwargs.get(data_name)
+            try:
+                size = data.nbytes if isinstance(data, memoryview) else len(data)
+            except TypeError:
+                # Uzunluğu olmayan girdi de işlemde hata verir ve "other" olarak sayılır.
+                size = 0
+            return stats.observe(operation, size, method, self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
 class EncryptionManager:
-    def __init__(self, shared_key: bytes):
+    # Alfabe ve indeks eşlemesi tüm örneklerce paylaşılır; örnek başına yalnızca
+    # anahtara özgü durum (anahtar, önceden anahtarlanmış HMAC) tutulur.
+    __slots__ = ("hmac_key", "engine", "suite", "stats", "_hmac_base")
+
+    all_characters = ALPHABET
+    n = ALPHABET_SIZE
+    char_to_index = CHAR_TO_INDEX
+
+    def __init__(self, shared_key: bytes, engine: str = "auto", suite: int = DEFAULT_SUITE, stats=None):
         if len(shared_key) < 32:
              raise ValueError("HMAC anahtarı en az 32 bayt olmalıdır.")
+        if engine not in ENGINES:
+            raise ValueError(f"Bilinmeyen motor: {engine}")
+        if engine == "numpy" and not NUMPY_AVAILABLE:
+            raise ValueError("NumPy motoru için 'numpy' kütüphanesi yüklü olmalıdır.")
+        if suite not in SUITES:
+            raise ValueError(f"Bilinmeyen şifre takımı: {suite}")
         self.hmac_key = shared_key
-        
-        turkish_characters = ["ç", "ğ", "ı", "İ", "ö", "ş", "ü", "Ç", "Ğ", "I", "Ö", "Ş", "Ü"]
-        self.all_characters = list({
-            normalize('NFKC', chr(i)) for i in range(256)
-        }.union({
-            normalize('NFKC', c) for c in turkish_characters
-        }))
-        self.n = len(self.all_characters) 
-        self.char_to_index = {char: idx for idx, char in enumerate(self.all_characters)}
-        
-    def _generate_transformation_table(self, iv_bytes: bytes):
-        
-        hmac_digest = hmac.new(self.hmac_key, iv_bytes, hashlib.sha256).digest()
-        
-        deterministic_seed = int.from_bytes(hmac_digest[:8], 'big')
-        
-        rng = random.Random(deterministic_seed) 
-
-        shuffled = self.all_characters[:]
-        rng.shuffle(shuffled)
-
-        transformation_table = {
-            self.all_characters[i]: shuffled[i] for i in range(self.n)
-        }
-        reverse_table = {
-            shuffled[i]: self.all_characters[i] for i in range(self.n)
-        }
-        return transformation_table, reverse_table
-
-    def encrypt(self, message: str) -> str:
-        
-        iv_bytes = secrets.token_bytes(4)
-        iv_int = int.from_bytes(iv_bytes, 'big')
-        
-        Te, _ = self._generate_transformation_table(iv_bytes)
-        
+        self.engine = engine
+        self.suite = suite
+        # İsteğe bağlı ölçüm toplayıcı (cipher_stats.CipherStats); süreç havuzlarına taşınmaz.
+        self.stats = stats
+        # Anahtar pad'leri bir kez türetilir; her HMAC bu durumun kopyasıyla başlar.
+        self._hmac_base = hmac.new(shared_key, digestmod=hashlib.sha256)
+
+    def __reduce__(self):
+        # HMAC durumu seri hale getirilemez; süreç havuzlarına anahtarla yeniden kurulur.
+        return (EncryptionManager, (self.hmac_key, self.engine, self.suite))
+
+    def _hmac(self, data: bytes) -> bytes:
+        mac = self._hmac_base.copy()
+        mac.update(data)
+        return mac.digest()
+
+    def _generate_transformation_table(self, iv_bytes: bytes, suite: int = SUITE_V1):
+
+        if suite == SUITE_V1:
+            hmac_digest = self._hmac(iv_bytes)
+
+            deterministic_seed = int.from_bytes(hmac_digest[:8], 'big')
+
+            rng = random.Random(deterministic_seed)
+
+            # Karıştırma yalnızca liste uzunluğuna bağlıdır; indeksleri karıştırmak
+            # karakter listesini karıştırmakla aynı permütasyonu verir.
+            shuffled = list(range(self.n))
+            rng.shuffle(shuffled)
+        else:
+            shuffled = self._keyed_shuffle(iv_bytes)
+
+        return array('H', shuffled)
+
+    def _generate_reverse_table(self, iv_bytes: bytes, suite: int = SUITE_V1):
+        permutation = self._generate_transformation_table(iv_bytes, suite)
+        inverse = array('H', permutation)
+        for i, p in enumerate(permutation):
+            inverse[p] = i
+        return inverse
+
+    def _keyed_shuffle(self, iv_bytes: bytes):
+        # Her adım için 32 bitlik bir değer; mod (i + 1) sapması en fazla n / 2^32.
+        seed = self._hmac(b"KILIM-v2-table" + iv_bytes)
+        steps = self.n - 1
+        values = struct.unpack(f'>{steps}I', hashlib.shake_256(seed).digest(4 * steps))
+
+        shuffled = list(range(self.n))
+        for i, value in zip(range(steps, 0, -1), values):
+            j = value % (i + 1)
+            shuffled[i], shuffled[j] = shuffled[j], shuffled[i]
+        return shuffled
+
+    def _initial_state(self, iv_bytes: bytes) -> int:
+        return int.from_bytes(iv_bytes, 'big') % self.n
+
+    def _use_numpy(self, length: int) -> bool:
+        if self.engine == "numpy":
+            return length > 0
+        return self.engine == "auto" and NUMPY_AVAILABLE and length >= NUMPY_MIN_LENGTH
+
+    def _numpy_indices(self, text: str, error: str):
+        lut = _get_numpy_tables()[0]
+        codepoints = np.frombuffer(text.encode('utf-32-le', 'surrogatepass'), dtype='<u4')
+        indices = lut[np.minimum(codepoints, len(lut) - 1)]
+        invalid = np.flatnonzero(indices < 0)
+        if invalid.size:
+            raise InvalidCharacterError(f"{error}: {text[invalid[0]]}")
+        return indices
+
+    def _numpy_join(self, indices) -> str:
+        return _get_numpy_tables()[1][indices].tobytes().decode('utf-32-le')
+
+    # n == 256 iken zincirleme uint8 aritmetiğiyle yapılır; taşma mod n
+    # işlemini kendiliğinden gerçekleştirir.
+
+    def _numpy_encrypt_indices(self, indices, permutation, prev: int):
+        if self.n == 256:
+            dynamic = np.cumsum(indices, dtype=np.uint8)
+            dynamic += np.uint8(prev)
+        else:
+            dynamic = (np.cumsum(indices, dtype=np.int64) + prev) % self.n
+        return np.frombuffer(permutation, dtype=np.uint16)[dynamic], int(dynamic[-1])
+
+    def _numpy_decrypt_indices(self, indices, inverse, prev: int):
+        dtype = np.uint8 if self.n == 256 else np.int64
+        transformed = np.frombuffer(inverse, dtype=np.uint16).astype(dtype)[indices]
+        previous = np.empty_like(transformed)
+        previous[0] = prev
+        previous[1:] = transformed[:-1]
+        decrypted = transformed - previous
+        if self.n != 256:
+            decrypted %= self.n
+        return decrypted, int(transformed[-1])
+
+    # Zincirleme çekirdeği: her parça, bir önceki parçanın bıraktığı `prev`
+    # durumundan devam eder ve yeni durumu döndürür.
+
+    def _encrypt_chunk(self, message: str, permutation, prev: int):
+        if self._use_numpy(len(message)):
+            indices = self._numpy_indices(message, "Geçersiz karakter")
+            encrypted, prev = self._numpy_encrypt_indices(indices, permutation, prev)
+            return self._numpy_join(encrypted), prev
+
+        # IV'ye özgü indeks -> çıktı tablosu; alfabedeki karakter nesnelerini paylaşır.
+        output = [ALPHABET[p] for p in permutation]
+        char_to_index = _CHAR_TO_INDEX
+        n = self.n
+
         encrypted = []
-        prev = iv_int % self.n 
-        
-        for char in message:
-            try:
-                idx = self.char_to_index[char]
-                dynamic_idx = (idx + prev) % self.n
-                encrypted_char = Te[self.all_characters[dynamic_idx]]
-                encrypted.append(encrypted_char)
-                prev = dynamic_idx
-            except KeyError as e:
-                raise ValueError(f"Geçersiz karakter: {e.args[0]}")
-                
-        
-        msg_length = len(message)
-        padding_length = secrets.randbelow(50) + 50
-        random_chars = [secrets.choice(self.all_characters) for _ in range(padding_length)]
-        encrypted += random_chars
-        
-        header_data = iv_bytes + msg_length.to_bytes(3, 'big')
-        hmac_digest = hmac.new(self.hmac_key, header_data, hashlib.sha256).digest()
-        full_header = hmac_digest + header_data
-        encoded_header = base64.urlsafe_b64encode(full_header).decode().rstrip('=')
-        
-        return encoded_header + ''.join(encrypted)
+        append = encrypted.append
 
-    def decrypt(self, cipher_text: str) -> str:
-        
-        header_len_bytes = 32 + 4 + 3 
-        encoded_header_length = (header_len_bytes * 4 + 2) // 3 
-        encoded_header = cipher_text[:encoded_header_length].encode()
-        cipher_body = cipher_text[encoded_header_length:]
-        missing_padding = len(encoded_header) % 4
-        if missing_padding:
-            encoded_header += b'=' * (4 - missing_padding)
-            
-        full_header = base64.urlsafe_b64decode(encoded_header)
-        
-        hmac_received = full_header[:32]
-        iv_bytes = full_header[32:36]
-        msg_length = int.from_bytes(full_header[36:39], 'big')
-        header_data = iv_bytes + msg_length.to_bytes(3, 'big')
-        hmac_calculated = hmac.new(self.hmac_key, header_data, hashlib.sha256).digest()
-        if not hmac.compare_digest(hmac_received, hmac_calculated):
-            raise ValueError("HMAC bütünlük doğrulama başarısız. Mesaj değiştirilmiş.")
+        try:
+            for char in message:
+                prev = (char_to_index[char] + prev) % n
+                append(output[prev])
+        except KeyError as e:
+            raise InvalidCharacterError(f"Geçersiz karakter: {e.args[0]}")
+
+        return ''.join(encrypted), prev
+
+    def _parallel_encrypt(self, message: str, permutation, prev: int, workers: int) -> str:
+        # I_k = (i_k + I_{k-1}) mod n bir önek toplamıdır. Her parça havuza bir kez
+        # gönderilir ve prev = 0 ile yerel önek toplamları döner. Başlangıç durumu s
+        # olan parçanın çıktısı permutation[(yerel + s) % n] olduğundan, parça
+        # başına 256 girdili bir tabloyla charmap_decode eşlemeyi C'de yapar.
+        size = -(-len(message) // workers)
+        chunks = [message[i:i + size] for i in range(0, len(message), size)]
+        output = [ALPHABET[p] for p in permutation]
+        n = self.n
+        encrypted = []
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for prefix in pool.map(_prefix_indices, chunks):
+                table = ''.join(output[(v + prev) % n] for v in range(n))
+                encrypted.append(codecs.charmap_decode(prefix, 'strict', table)[0])
+                prev = (prefix[-1] + prev) % n
+        return ''.join(encrypted)
+
+    def _decrypt_chunk(self, data: str, inverse, prev: int):
+        if self._use_numpy(len(data)):
+            indices = self._numpy_indices(data, "Geçersiz şifreli karakter, çözme başarısız")
+            decrypted, prev = self._numpy_decrypt_indices(indices, inverse, prev)
+            return self._numpy_join(decrypted), prev
+
+        all_characters = ALPHABET
+        char_to_index = _CHAR_TO_INDEX
+        n = self.n
 
-        _, Td = self._generate_transformation_table(iv_bytes)
-        
         decrypted = []
-        iv_int = int.from_bytes(iv_bytes, 'big')
-        prev = iv_int % self.n 
-        
-        data_to_decrypt = cipher_body[:msg_length]
-        
-        for char in data_to_decrypt:
-            try:
-                transformed_char = Td[char]
-                transformed_idx = self.char_to_index[transformed_char]
-                
-                original_idx = (transformed_idx - prev) % self.n
-                
-                decrypted.append(self.all_characters[original_idx])
-                
+        append = decrypted.append
+
+        try:
+            for char in data:
+                transformed_idx = inverse[char_to_index[char]]
+                append(all_characters[(transformed_idx - prev) % n])
                 prev = transformed_idx
-                
-            except KeyError as e:
-                raise ValueError(f"Geçersiz şifreli karakter, çözme başarısız: {e.args[0]}")
-                
-        return ''.join(decrypted)
-    
+        except KeyError as e:
+            raise InvalidCharacterError(f"Geçersiz şifreli karakter, çözme başarısız: {e.args[0]}")
+
+        return ''.join(decrypted), prev
+
+    def _encrypt_byte_chunk(self, data, permutation, prev: int, out) -> int:
+        if self._use_numpy(len(data)):
+            encrypted, prev = self._numpy_encrypt_indices(np.frombuffer(data, dtype=np.uint8), permutation, prev)
+            np.frombuffer(out, dtype=np.uint8, count=len(data))[:] = encrypted
+            return prev
+
+        n = self.n
+        encrypted = bytearray()
+        append = encrypted.append
+        for b in data:
+            prev = (b + prev) % n
+            append(permutation[prev])
+        out[:len(data)] = encrypted
+        return prev
+
+    def _decrypt_byte_chunk(self, data, inverse, prev: int, out) -> int:
+        if self._use_numpy(len(data)):
+            decrypted, prev = self._numpy_decrypt_indices(np.frombuffer(data, dtype=np.uint8), inverse, prev)
+            np.frombuffer(out, dtype=np.uint8, count=len(data))[:] = decrypted
+            return prev
+
+        n = self.n
+        decrypted = bytearray()
+        append = decrypted.append
+        for c in data:
+            transformed_idx = inverse[c]
+            append((transformed_idx - prev) % n)
+            prev = transformed_idx
+        out[:len(data)] = decrypted
+        return prev
+
+    def _padding(self) -> str:
+        padding_length = secrets.randbelow(MAX_PADDING - MIN_PADDING + 1) + MIN_PADDING
+        return ''.join(map(_BYTE_TO_CHAR.__getitem__, secrets.token_bytes(padding_length)))
+
+    def _byte_padding(self) -> bytes:
+        padding_length = secrets.randbelow(MAX_PADDING - MIN_PADDING + 1) + MIN_PADDING
+        return secrets.token_bytes(padding_length)
+
+    def _sign_header(self, iv_bytes: bytes, msg_length: int, suite: int) -> bytes:
+        if msg_length > MAX_MESSAGE_LENGTH:
+            raise ValueError(f"Mesaj çok uzun: en fazla {MAX_MESSAGE_LENGTH} karakter şifrelenebilir.")
+        header_data = iv_bytes + msg_length.to_bytes(3, 'big')
+        if suite == SUITE_V1:
+            return self._hmac(header_data) + header_data
+        version = bytes([suite])
+        return version + self._hmac(version + header_data) + header_data
+
+    def _check_header(self, full_header: bytes, suite: int):
+        if suite == SUITE_V1:
+            hmac_received = full_header[:32]
+            header_data = full_header[32:39]
+            signed = header_data
+        else:
+            hmac_received = full_header[1:33]
+            header_data = full_header[33:40]
+            signed = full_header[:1] + header_data
+        hmac_calculated = self._hmac(signed)
+        return hmac.compare_digest(hmac_received, hmac_calculated), header_data[:4], int.from_bytes(header_data[4:7], 'big')
+
+    def _verify_header(self, full_header: bytes, v1_header: bytes = None):
+        # v1 başlığı sürüm baytı taşımaz; ilk baytı v2 ile çakışan v1 başlıkları
+        # v2 HMAC'i tutmadığında v1 olarak yeniden denenir.
+        if full_header[:1] == bytes([SUITE_V2]) and len(full_header) >= HEADER_BYTES[SUITE_V2]:
+            valid, iv_bytes, msg_length = self._check_header(full_header, SUITE_V2)
+            if valid:
+                return SUITE_V2, iv_bytes, msg_length
+        valid, iv_bytes, msg_length = self._check_header(full_header if v1_header is None else v1_header, SUITE_V1)
+        if not valid:
+            raise IntegrityError("HMAC bütünlük doğrulama başarısız. Mesaj değiştirilmiş.")
+        return SUITE_V1, iv_bytes, msg_length
+
+    def _encode_header(self, iv_bytes: bytes, msg_length: int, suite: int) -> str:
+        full_header = self._sign_header(iv_bytes, msg_length, suite)
+        encoded = binascii.b2a_base64(full_header, newline=False).translate(_URLSAFE_B64)
+        return encoded[:ENCODED_HEADER_LENGTH[suite]].decode('ascii')
+
+    def _decode_header(self, cipher_text: str):
+        if len(cipher_text) < ENCODED_HEADER_LENGTH[SUITE_V1]:
+            raise ValueError("Şifreli metin başlıktan kısa, çözme başarısız.")
+        # v1 başlığı tam 52 karakterdir. v2 adayı iki karakter daha uzundur; v1
+        # mesajlarda bu iki karakter gövdeye ait olup base64 olmayabilir.
+        v1_header = base64.urlsafe_b64decode(cipher_text[:ENCODED_HEADER_LENGTH[SUITE_V1]].encode())
+        full_header = v1_header
+        if v1_header[:1] == bytes([SUITE_V2]):
+            try:
+                full_header = base64.urlsafe_b64decode(cipher_text[:ENCODED_HEADER_LENGTH[SUITE_V2]].encode('ascii') + b'==')
+            except ValueError:
+                pass
+        suite, iv_bytes, msg_length = self._verify_header(full_header, v1_header)
+        return suite, iv_bytes, msg_length, ENCODED_HEADER_LENGTH[suite]
+
+    @_instrumented("encrypt")
+    def encrypt(self, message: str, workers: int = 1) -> str:
+
+        iv_bytes = secrets.token_bytes(4)
+        encoded_header = self._encode_header(iv_bytes, len(message), self.suite)
+
+        permutation = self._generate_transformation_table(iv_bytes, self.suite)
+        # NumPy motoru tek süreçte havuz kurulumundan hızlıdır; havuz yalnızca
+        # karakter döngüsü kullanılacaksa açılır.
+        if workers > 1 and len(message) >= PARALLEL_MIN_LENGTH and not self._use_numpy(len(message)):
+            encrypted = self._parallel_encrypt(message, permutation, self._initial_state(iv_bytes), workers)
+        else:
+            encrypted, _ = self._encrypt_chunk(message, permutation, self._initial_state(iv_bytes))
+
+        return encoded_header + encrypted + self._padding()
+
+    @_instrumented("decrypt")
+    def decrypt(self, cipher_text: str) -> str:
+
+        suite, iv_bytes, msg_length, body_start = self._decode_header(cipher_text)
+        data_to_decrypt = cipher_text[body_start:body_start + msg_length]
+        if len(data_to_decrypt) < msg_length:
+            raise ValueError("Şifreli metin eksik, çözme başarısız.")
+
+        inverse = self._generate_reverse_table(iv_bytes, suite)
+        decrypted, _ = self._decrypt_chunk(data_to_decrypt, inverse, self._initial_state(iv_bytes))
+        return decrypted
+
+    @_instrumented("decrypt_range")
+    def decrypt_range(self, cipher_text: str, start: int, end: int) -> str:
+        """Yalnızca [start, end) aralığındaki düz metin karakterlerini çözer."""
+        if not 0 <= start <= end:
+            raise ValueError("Geçersiz aralık: 0 <= start <= end olmalıdır.")
+
+        suite, iv_bytes, msg_length, body_start = self._decode_header(cipher_text)
+        end = min(end, msg_length)
+        if start >= end:
+            return ''
+        if len(cipher_text) < body_start + end:
+            raise ValueError("Şifreli metin eksik, çözme başarısız.")
+
+        inverse = self._generate_reverse_table(iv_bytes, suite)
+        # Her konum yalnızca kendisinden önceki şifreli karaktere bağlıdır.
+        if start == 0:
+            prev = self._initial_state(iv_bytes)
+        else:
+            previous_char = cipher_text[body_start + start - 1]
+            if previous_char not in self.char_to_index:
+                raise InvalidCharacterError(f"Geçersiz şifreli karakter, çözme başarısız: {previous_char}")
+            prev = inverse[self.char_to_index[previous_char]]
+
+        decrypted, _ = self._decrypt_chunk(cipher_text[body_start + start:body_start + end], inverse, prev)
+        return decrypted
+
+    # Toplu işlem: girdiler `batch_size` büyüklüğünde gruplara bölünür ve her
+    # grup tek görev olarak havuza verilir. Sıra korunur; hatalı öğeler
+    # BatchResult.error ile raporlanır, toplu işlemi durdurmaz.
+
+    def encrypt_many(self, messages, workers: int = 1, executor: str = "thread", batch_size: int = DEFAULT_BATCH_SIZE):
+        return self._run_many("encrypt", messages, workers, executor, batch_size)
+
+    def decrypt_many(self, cipher_texts, workers: int = 1, executor: str = "thread", batch_size: int = DEFAULT_BATCH_SIZE):
+        return self._run_many("decrypt", cipher_texts, workers, executor, batch_size)
+
+    def _run_many(self, operation_name: str, items, workers: int, executor: str, batch_size: int):
+        if executor not in EXECUTORS:
+            raise ValueError(f"Bilinmeyen havuz türü: {executor}")
+        if batch_size < 1:
+            raise ValueError("Grup boyutu en az 1 olmalıdır.")
+
+        items = iter(items)
+        batches = iter(lambda: list(islice(items, batch_size)), [])
+
+        results = []
+        if workers <= 1:
+            operation = getattr(self, operation_name)
+            for batch in batches:
+                results += _run_batch(operation, batch)
+            return results
+
+        if executor == "thread":
+            operation = getattr(self, operation_name)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                for batch_results in pool.map(_run_batch, iter(lambda: operation, None), batches):
+                    results += batch_results
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_batch_worker,
+                                     initargs=(self.hmac_key, self.engine, self.suite)) as pool:
+                for batch_results in pool.map(_process_batch, iter(lambda: operation_name, None), batches):
+                    results += batch_results
+        return results
+
+    # Bayt arabirimi: her bayt doğrudan bir alfabe indeksidir (n == 256) ve
+    # çıktı [başlık | gövde | dolgu] biçiminde ham indekslerden oluşur.
+
+    @staticmethod
+    def encrypted_size_bound(length: int) -> int:
+        return MAX_HEADER_BYTES + length + MAX_PADDING
+
+    def _check_byte_alphabet(self):
+        if self.n != 256:
+            raise ValueError("Bayt arabirimi 256 karakterlik alfabe gerektirir.")
+
+    # encrypt_bytes/decrypt_bytes bu yöntemlere dayanır; bayt arabirimi ölçümlerde
+    # genel adıyla görünür.
+    @_instrumented("encrypt_bytes")
+    def encrypt_into(self, data, out) -> int:
+        self._check_byte_alphabet()
+        data = memoryview(data).cast('B')
+        out = memoryview(out).cast('B')
+        msg_length = len(data)
+        if len(out) < self.encrypted_size_bound(msg_length):
+            raise ValueError(f"Çıktı tamponu yetersiz: en az {self.encrypted_size_bound(msg_length)} bayt gerekli.")
+
+        iv_bytes = secrets.token_bytes(4)
+        header = self._sign_header(iv_bytes, msg_length, self.suite)
+        out[:len(header)] = header
+
+        permutation = self._generate_transformation_table(iv_bytes, self.suite)
+        end = len(header) + msg_length
+        self._encrypt_byte_chunk(data, permutation, self._initial_state(iv_bytes), out[len(header):end])
+
+        padding = self._byte_padding()
+        out[end:end + len(padding)] = padding
+        return end + len(padding)
+
+    def encrypt_bytes(self, data) -> bytes:
+        out = bytearray(self.encrypted_size_bound(memoryview(data).nbytes))
+        written = self.encrypt_into(data, out)
+        return bytes(memoryview(out)[:written])
+
+    @_instrumented("decrypt_bytes")
+    def decrypt_into(self, data, out) -> int:
+        self._check_byte_alphabet()
+        data = memoryview(data).cast('B')
+        if len(data) < HEADER_BYTES[SUITE_V1]:
+            raise ValueError("Şifreli veri başlıktan kısa, çözme başarısız.")
+        suite, iv_bytes, msg_length = self._verify_header(bytes(data[:MAX_HEADER_BYTES]))
+
+        body_start = HEADER_BYTES[suite]
+        body = data[body_start:body_start + msg_length]
+        # Gövde uzunluğu HMAC ile doğrulanmış başlıktaki uzunlukla eşleşmelidir.
+        if len(body) < msg_length:
+            raise ValueError("Şifreli veri eksik, çözme başarısız.")
+        out = memoryview(out).cast('B')
+        if len(out) < len(body):
+            raise ValueError(f"Çıktı tamponu yetersiz: en az {len(body)} bayt gerekli.")
+
+        inverse = self._generate_reverse_table(iv_bytes, suite)
+        self._decrypt_byte_chunk(body, inverse, self._initial_state(iv_bytes), out)
+        return len(body)
+
+    def decrypt_bytes(self, data) -> bytes:
+        out = bytearray(max(memoryview(data).nbytes - HEADER_BYTES[SUITE_V1], 0))
+        written = self.decrypt_into(data, out)
+        return bytes(memoryview(out)[:written])
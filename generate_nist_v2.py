@@ -9,10 +9,58 @@ import sys
 import traceback
 from encryption_manager import EncryptionManager 
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 OUTPUT_FILENAME = "nist_large_750MB.bin"
 TARGET_SIZE_MB = 750  
 MASTER_KEY = secrets.token_bytes(32)
 
+def build_value_table(char_map):
+    # Kod noktası -> 7 bitlik değer; haritada olmayan ya da 128 ve üzeri değerli
+    # karakterler (ve tablo dışı kod noktaları için son eleman) -1 ile atlanır.
+    table = np.full(max(map(ord, char_map)) + 2, -1, dtype=np.int16)
+    for char, val in char_map.items():
+        if val < 128:
+            table[ord(char)] = val
+    return table
+
+
+def pack_7bit_numpy(cipher_text, table, carry):
+    """
+    Geçerli karakterlerin 7 bitlik değerlerini tek bit akışında birleştirir ve
+    tam baytları döndürür; 8'e tamamlanmayan bitler `carry` olarak sonraki
+    şifreli metne aktarılır (Python döngüsüyle aynı bit sırası).
+    """
+    codepoints = np.frombuffer(cipher_text.encode('utf-32-le', 'surrogatepass'), dtype='<u4')
+    vals = table[np.minimum(codepoints, len(table) - 1)]
+    vals = vals[vals >= 0].astype(np.uint8)
+    bits = np.unpackbits(vals[:, None], axis=1)[:, 1:].ravel()
+    if carry.size:
+        bits = np.concatenate((carry, bits))
+    usable = bits.size - bits.size % 8
+    return np.packbits(bits[:usable]).tobytes(), bits[usable:]
+
+
+def pack_7bit_python(cipher_text, char_map, bit_buffer, bits_in_buffer):
+    packed = bytearray()
+    for char in cipher_text:
+        val = char_map.get(char)
+        if val is None or val >= 128:
+            continue
+        bit_buffer = (bit_buffer << 7) | val
+        bits_in_buffer += 7
+        while bits_in_buffer >= 8:
+            bits_in_buffer -= 8
+            packed.append((bit_buffer >> bits_in_buffer) & 0xFF)
+        # Tüketilen bitler atılır; tampon en fazla 14 bit tutar.
+        bit_buffer &= (1 << bits_in_buffer) - 1
+    return packed, bit_buffer, bits_in_buffer
+
+
 def worker_generate_chunk(args):
     try:
         target_chunk_size, char_map, key, seed, task_id = args
@@ -28,30 +76,23 @@ def worker_generate_chunk(args):
         byte_chunk = bytearray()
         bit_buffer = 0
         bits_in_buffer = 0
+        if NUMPY_AVAILABLE:
+            table = build_value_table(char_map)
+            carry = np.empty(0, dtype=np.uint8)
         
         while len(byte_chunk) < target_chunk_size:
             dummy_text = "".join(random.choices(base_chars, k=internal_batch_size))
             
             cipher_text = manager.encrypt(dummy_text)
             
-            for char in cipher_text:
-                if char not in char_map:
-                    continue
-                
-                val = char_map[char]
-                
-                if val < 128:
-                    bit_buffer = (bit_buffer << 7) | val
-                    bits_in_buffer += 7
-                    
-                    while bits_in_buffer >= 8:
-                        bits_in_buffer -= 8
-                        byte_val = (bit_buffer >> bits_in_buffer) & 0xFF
-                        byte_chunk.append(byte_val)
-                        
-                        if len(byte_chunk) >= target_chunk_size:
-                            return byte_chunk
+            if NUMPY_AVAILABLE:
+                packed, carry = pack_7bit_numpy(cipher_text, table, carry)
+            else:
+                packed, bit_buffer, bits_in_buffer = pack_7bit_python(cipher_text, char_map, bit_buffer, bits_in_buffer)
+            byte_chunk += packed
         
+        # Hedefe ulaşıldığı bayttan sonrası atılır; parça boyu tam hedef kadardır.
+        del byte_chunk[target_chunk_size:]
         return byte_chunk
 
     except Exception as e:
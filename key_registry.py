@@ -0,0 +1,86 @@
+import threading
+from collections import OrderedDict
+from encryption_manager import EncryptionManager, DEFAULT_SUITE
+
+
+class KeyRegistry:
+    """
+    Anahtar kimliklerini EncryptionManager bağlamlarına eşleyen, boyutu sınırlı
+    LRU önbellek. Bağlamlar alfabeyi paylaşır ve yalnızca anahtara özgü durumu
+    taşır; `key_loader(key_id)` yalnızca önbellekte olmayan anahtarlar için
+    çağrılır ve anahtar baytlarını döndürmelidir.
+    """
+    def __init__(self, key_loader, max_size: int = 1024, engine: str = "auto", suite: int = DEFAULT_SUITE, stats=None):
+        if max_size < 1:
+            raise ValueError("Önbellek boyutu en az 1 olmalıdır.")
+        self._key_loader = key_loader
+        self._max_size = max_size
+        self._engine = engine
+        self._suite = suite
+        self._stats = stats
+        self._contexts = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key_id) -> EncryptionManager:
+        with self._lock:
+            context = self._contexts.get(key_id)
+            if context is not None:
+                self._contexts.move_to_end(key_id)
+                self.hits += 1
+                return context
+            self.misses += 1
+
+        # Anahtar yükleyici yavaş olabilir (KMS, veritabanı); kilit dışında çağrılır.
+        context = EncryptionManager(self._key_loader(key_id), self._engine, self._suite, self._stats)
+
+        with self._lock:
+            existing = self._contexts.get(key_id)
+            if existing is not None:
+                self._contexts.move_to_end(key_id)
+                return existing
+            self._contexts[key_id] = context
+            if len(self._contexts) > self._max_size:
+                self._contexts.popitem(last=False)
+                self.evictions += 1
+        return context
+
+    def encrypt(self, key_id, message: str) -> str:
+        return self.get(key_id).encrypt(message)
+
+    def decrypt(self, key_id, cipher_text: str) -> str:
+        return self.get(key_id).decrypt(cipher_text)
+
+    def encrypt_bytes(self, key_id, data) -> bytes:
+        return self.get(key_id).encrypt_bytes(data)
+
+    def decrypt_bytes(self, key_id, data) -> bytes:
+        return self.get(key_id).decrypt_bytes(data)
+
+    def invalidate(self, key_id):
+        with self._lock:
+            self._contexts.pop(key_id, None)
+
+    def clear(self):
+        with self._lock:
+            self._contexts.clear()
+
+    def __len__(self):
+        return len(self._contexts)
+
+    def __contains__(self, key_id):
+        return key_id in self._contexts
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._contexts),
+                "max_size": self._max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
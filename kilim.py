@@ -0,0 +1,120 @@
+"""
+KILIM komut satırı aracı (Qt gerektirmez).
+
+    python -m kilim keygen -o anahtar.bin
+    python -m kilim encrypt -k anahtar.bin < girdi > girdi.kilim
+    python -m kilim decrypt -k anahtar.bin -i girdi.kilim -o girdi --stats
+
+Veriler kapsayıcı biçiminde (container_format) sabit boyutlu parçalar halinde
+işlenir; bellek kullanımı girdi boyutundan bağımsızdır.
+"""
+import argparse
+import os
+import secrets
+import sys
+import time
+from container_format import DEFAULT_CHUNK_SIZE, encrypt_stream, decrypt_stream
+
+KEY_ENV = "KILIM_KEY"
+
+
+class _CountingReader:
+    def __init__(self, raw):
+        self._raw = raw
+        self.count = 0
+
+    def read(self, size=-1):
+        data = self._raw.read(size)
+        self.count += len(data)
+        return data
+
+
+def _load_key(args) -> bytes:
+    if args.key_hex:
+        return bytes.fromhex(args.key_hex)
+    if args.key_file:
+        with open(args.key_file, 'rb') as fk:
+            return fk.read()
+    if os.environ.get(KEY_ENV):
+        return bytes.fromhex(os.environ[KEY_ENV])
+    raise ValueError(f"Anahtar verilmedi: --key-file, --key-hex veya {KEY_ENV} kullanın.")
+
+
+def _report(label: str, read: int, written: int, elapsed: float):
+    mb = read / (1024 * 1024)
+    print(f"{label}: {read} bayt -> {written} bayt | {elapsed:.3f} s | {mb / max(elapsed, 1e-9):.2f} MB/s",
+          file=sys.stderr)
+
+
+def _run(args) -> int:
+    if args.command == "keygen":
+        key = secrets.token_bytes(32)
+        if args.output:
+            with open(args.output, 'wb') as fk:
+                fk.write(key)
+        else:
+            print(key.hex())
+        return 0
+
+    key = _load_key(args)
+    source = open(args.input, 'rb') if args.input else sys.stdin.buffer
+    sink = open(args.output, 'wb') if args.output else sys.stdout.buffer
+    reader = _CountingReader(source)
+    start = time.perf_counter()
+    try:
+        if args.command == "encrypt":
+            written = encrypt_stream(key, reader, sink, args.chunk_size, args.workers)
+        else:
+            written = decrypt_stream(key, reader, sink, args.workers)
+        sink.flush()
+    except BaseException:
+        if args.output:
+            # Doğrulanmamış yarım çıktı diskte bırakılmaz.
+            sink.close()
+            os.remove(args.output)
+        raise
+    finally:
+        if args.input:
+            source.close()
+        if args.output and not sink.closed:
+            sink.close()
+
+    if args.stats:
+        label = "Şifreleme" if args.command == "encrypt" else "Çözme"
+        _report(label, reader.count, written, time.perf_counter() - start)
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m kilim", description="KILIM akış şifreleme aracı")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    keygen = commands.add_parser("keygen", help="32 baytlık rastgele anahtar üretir")
+    keygen.add_argument("-o", "--output", help="anahtar dosyası (verilmezse onaltılık olarak yazdırılır)")
+
+    for name, help_text in (("encrypt", "girdiyi şifreler"), ("decrypt", "kapsayıcıyı doğrular ve çözer")):
+        command = commands.add_parser(name, help=help_text)
+        command.add_argument("-i", "--input", help="girdi dosyası (varsayılan: stdin)")
+        command.add_argument("-o", "--output", help="çıktı dosyası (varsayılan: stdout)")
+        command.add_argument("-k", "--key-file", help="ham anahtar dosyası")
+        command.add_argument("--key-hex", help="onaltılık anahtar")
+        command.add_argument("-w", "--workers", type=int, default=1,
+                             help="paralel işçi süreç sayısı (varsayılan: %(default)s)")
+        command.add_argument("--stats", action="store_true", help="süre ve hızı stderr'e yazar")
+        if name == "encrypt":
+            command.add_argument("-c", "--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                                 help="parça boyutu, bayt (varsayılan: %(default)s)")
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    try:
+        return _run(args)
+    except (ValueError, OSError) as e:
+        print(f"Hata: {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+import secrets
+from encryption_manager import EncryptionManager, HEADER_BYTES, MAX_ENCODED_HEADER_LENGTH, MAX_HEADER_BYTES, MAX_MESSAGE_LENGTH
+
+
+class Encryptor:
+    """
+    Parça parça şifreleme bağlamı. Başlık mesaj uzunluğunu içerdiğinden toplam
+    uzunluk baştan verilir; `prev` zincir durumu update() çağrıları arasında
+    taşınır, böylece bellek kullanımı girdi boyutundan bağımsız kalır.
+    Çıktıların birleşimi EncryptionManager.encrypt / encrypt_bytes biçimindedir.
+    """
+    def __init__(self, manager: EncryptionManager, length: int, binary: bool = False):
+        if not 0 <= length <= MAX_MESSAGE_LENGTH:
+            raise ValueError(f"Mesaj uzunluğu 0 ile {MAX_MESSAGE_LENGTH} arasında olmalıdır.")
+        if binary:
+            manager._check_byte_alphabet()
+        self._manager = manager
+        self._binary = binary
+        self._remaining = length
+        self._finalized = False
+
+        iv_bytes = secrets.token_bytes(4)
+        if binary:
+            self._header = manager._sign_header(iv_bytes, length, manager.suite)
+        else:
+            self._header = manager._encode_header(iv_bytes, length, manager.suite)
+        self._permutation = manager._generate_transformation_table(iv_bytes, manager.suite)
+        self._prev = manager._initial_state(iv_bytes)
+
+    def _take_header(self):
+        header = self._header
+        self._header = b'' if self._binary else ''
+        return header
+
+    def update(self, chunk):
+        if self._finalized:
+            raise ValueError("Şifreleme bağlamı zaten tamamlandı.")
+        if len(chunk) > self._remaining:
+            raise ValueError("Bildirilen mesaj uzunluğu aşıldı.")
+        self._remaining -= len(chunk)
+
+        if self._binary:
+            chunk = memoryview(chunk).cast('B')
+            out = bytearray(len(chunk))
+            self._prev = self._manager._encrypt_byte_chunk(chunk, self._permutation, self._prev, memoryview(out))
+            return self._take_header() + bytes(out)
+
+        encrypted, self._prev = self._manager._encrypt_chunk(chunk, self._permutation, self._prev)
+        return self._take_header() + encrypted
+
+    def finalize(self):
+        if self._finalized:
+            raise ValueError("Şifreleme bağlamı zaten tamamlandı.")
+        if self._remaining:
+            raise ValueError(f"Mesaj eksik: {self._remaining} karakter daha bekleniyordu.")
+        self._finalized = True
+        padding = self._manager._byte_padding() if self._binary else self._manager._padding()
+        return self._take_header() + padding
+
+
+class Decryptor:
+    """
+    Parça parça çözme bağlamı. Başlık tamamlanana kadar girdi biriktirilir ve
+    HMAC doğrulanır (şifre takımı başlıktan anlaşılır); ardından gövde
+    geldikçe çözülür, dolgu yok sayılır.
+    """
+    def __init__(self, manager: EncryptionManager, binary: bool = False):
+        if binary:
+            manager._check_byte_alphabet()
+        self._manager = manager
+        self._binary = binary
+        self._pending = b'' if binary else ''
+        self._inverse = None
+        self._prev = 0
+        self._remaining = None
+        self._finalized = False
+
+    def _read_header(self):
+        # En uzun başlık kadar veri beklenir; dolgu en az MIN_PADDING olduğundan
+        # kısa başlıklı (v1) mesajlar da bu uzunluğa her zaman ulaşır.
+        if self._binary:
+            if len(self._pending) < MAX_HEADER_BYTES:
+                return None
+            suite, iv_bytes, msg_length = self._manager._verify_header(self._pending[:MAX_HEADER_BYTES])
+            body_start = HEADER_BYTES[suite]
+        else:
+            if len(self._pending) < MAX_ENCODED_HEADER_LENGTH:
+                return None
+            suite, iv_bytes, msg_length, body_start = self._manager._decode_header(self._pending)
+
+        self._inverse = self._manager._generate_reverse_table(iv_bytes, suite)
+        self._prev = self._manager._initial_state(iv_bytes)
+        self._remaining = msg_length
+        rest = self._pending[body_start:]
+        self._pending = None
+        return rest
+
+    def update(self, chunk):
+        if self._finalized:
+            raise ValueError("Çözme bağlamı zaten tamamlandı.")
+        if self._binary:
+            chunk = bytes(chunk)
+
+        if self._remaining is None:
+            self._pending += chunk
+            chunk = self._read_header()
+            if chunk is None:
+                return b'' if self._binary else ''
+
+        data = chunk[:self._remaining]
+        self._remaining -= len(data)
+
+        if self._binary:
+            out = bytearray(len(data))
+            self._prev = self._manager._decrypt_byte_chunk(memoryview(data), self._inverse, self._prev, memoryview(out))
+            return bytes(out)
+
+        decrypted, self._prev = self._manager._decrypt_chunk(data, self._inverse, self._prev)
+        return decrypted
+
+    def finalize(self):
+        if self._finalized:
+            raise ValueError("Çözme bağlamı zaten tamamlandı.")
+        if self._remaining is None or self._remaining:
+            raise ValueError("Şifreli veri eksik, çözme başarısız.")
+        self._finalized = True
+        return b'' if self._binary else ''
@@ -0,0 +1,59 @@
+import io
+import secrets
+
+import pytest
+
+from container_format import FILE_HEADER, FRAME_HEADER, TAG_SIZE, decrypt_stream, encrypt_stream
+from encrypted_reader import EncryptedFileReader
+
+KEY = secrets.token_bytes(32)
+CHUNK_SIZE = 1000
+
+
+def _encrypt(data: bytes) -> bytearray:
+    sink = io.BytesIO()
+    encrypt_stream(KEY, io.BytesIO(data), sink, chunk_size=CHUNK_SIZE, workers=1)
+    return bytearray(sink.getvalue())
+
+
+def _decrypt(blob) -> bytes:
+    sink = io.BytesIO()
+    decrypt_stream(KEY, io.BytesIO(bytes(blob)), sink, workers=1)
+    return sink.getvalue()
+
+
+def _payload_offset(blob, index: int) -> int:
+    offset = FILE_HEADER.size
+    for _ in range(index):
+        length, _ = FRAME_HEADER.unpack_from(blob, offset)
+        offset += FRAME_HEADER.size + TAG_SIZE + length
+    return offset + FRAME_HEADER.size + TAG_SIZE
+
+
+def test_round_trip():
+    data = secrets.token_bytes(3000)
+    assert _decrypt(_encrypt(data)) == data
+
+
+def test_tampered_chunk_body_is_rejected(tmp_path):
+    blob = _encrypt(secrets.token_bytes(3000))
+    blob[_payload_offset(blob, 1) + 100] ^= 0x01
+    with pytest.raises(ValueError, match="HMAC"):
+        _decrypt(blob)
+
+    path = tmp_path / "tampered.kilim"
+    path.write_bytes(blob)
+    with EncryptedFileReader(KEY, str(path)) as reader:
+        reader.seek(CHUNK_SIZE)
+        with pytest.raises(ValueError, match="HMAC"):
+            reader.read(10)
+
+
+def test_truncated_chunk_is_rejected():
+    blob = _encrypt(secrets.token_bytes(3000))
+    start = _payload_offset(blob, 2)
+    length, flags = FRAME_HEADER.unpack_from(blob, start - FRAME_HEADER.size - TAG_SIZE)
+    del blob[start + length - 200:start + length]
+    FRAME_HEADER.pack_into(blob, start - FRAME_HEADER.size - TAG_SIZE, length - 200, flags)
+    with pytest.raises(ValueError, match="HMAC"):
+        _decrypt(blob)
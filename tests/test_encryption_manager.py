@@ -0,0 +1,97 @@
+import random
+import secrets
+
+import pytest
+
+from cipher_stats import CipherStats
+from encryption_manager import ALPHABET, NUMPY_AVAILABLE, PARALLEL_MIN_LENGTH, SUITE_V1, SUITE_V2, EncryptionManager
+
+KEY = secrets.token_bytes(32)
+
+
+@pytest.fixture
+def fixed_iv(monkeypatch):
+    # IV, dolgu baytları ve dolgu uzunluğu sabitlenir; şifreli metin tekrarlanabilir olur.
+    monkeypatch.setattr(secrets, "token_bytes", lambda n: bytes(range(1, n + 1)))
+    monkeypatch.setattr(secrets, "randbelow", lambda n: 0)
+
+
+def _text(size: int, seed: int = 0) -> str:
+    return "".join(random.Random(seed).choices(ALPHABET, k=size))
+
+
+@pytest.mark.skipif(not NUMPY_AVAILABLE, reason="numpy yüklü değil")
+@pytest.mark.parametrize("size", [1, 100, 5000])
+def test_numpy_engine_matches_python(fixed_iv, size):
+    python_cipher = EncryptionManager(KEY, engine="python")
+    numpy_cipher = EncryptionManager(KEY, engine="numpy")
+    text = _text(size)
+    payload = random.Random(size).randbytes(size)
+
+    cipher_text = python_cipher.encrypt(text)
+    assert numpy_cipher.encrypt(text) == cipher_text
+    assert numpy_cipher.decrypt(cipher_text) == python_cipher.decrypt(cipher_text) == text
+
+    packet = python_cipher.encrypt_bytes(payload)
+    assert numpy_cipher.encrypt_bytes(payload) == packet
+    assert numpy_cipher.decrypt_bytes(packet) == python_cipher.decrypt_bytes(packet) == payload
+
+
+def test_parallel_encrypt_matches_serial(fixed_iv):
+    cipher = EncryptionManager(KEY, engine="python")
+    text = _text(PARALLEL_MIN_LENGTH + 12345)
+    assert cipher.encrypt(text, workers=3) == cipher.encrypt(text)
+
+
+def _v1_iv_colliding_with_v2(cipher: EncryptionManager, msg_length: int) -> bytes:
+    # v1 başlığı HMAC ile başlar; ilk baytı v2 sürüm baytına eşit olan bir IV aranır.
+    for counter in range(1 << 16):
+        iv_bytes = counter.to_bytes(4, 'big')
+        if cipher._hmac(iv_bytes + msg_length.to_bytes(3, 'big'))[0] == SUITE_V2:
+            return iv_bytes
+    raise AssertionError("uygun IV bulunamadı")
+
+
+@pytest.mark.parametrize("size", [0, 1, 300])
+def test_v1_header_starting_with_v2_version_byte_falls_back(monkeypatch, size):
+    v1_cipher = EncryptionManager(KEY, suite=SUITE_V1)
+    iv_bytes = _v1_iv_colliding_with_v2(v1_cipher, size)
+    monkeypatch.setattr(secrets, "token_bytes", lambda n: iv_bytes if n == 4 else bytes(n))
+    text = _text(size)
+    payload = random.Random(size).randbytes(size)
+
+    packet = v1_cipher.encrypt_bytes(payload)
+    assert packet[0] == SUITE_V2
+    cipher_text = v1_cipher.encrypt(text)
+
+    for cipher in (v1_cipher, EncryptionManager(KEY)):
+        assert cipher.decrypt(cipher_text) == text
+        assert cipher.decrypt_bytes(packet) == payload
+
+
+@pytest.mark.parametrize("engine", ["python", "auto"])
+def test_decrypt_range_matches_decrypt_slice(fixed_iv, engine):
+    cipher = EncryptionManager(KEY, engine=engine)
+    text = _text(2000)
+    cipher_text = cipher.encrypt(text)
+    decrypted = cipher.decrypt(cipher_text)
+    for start, end in [(0, 0), (0, 1), (0, 2000), (1, 2), (37, 1500), (1999, 2000), (1500, 5000), (2000, 2100), (3000, 4000)]:
+        assert cipher.decrypt_range(cipher_text, start, end) == decrypted[start:end]
+
+
+@pytest.mark.parametrize("with_stats", [False, True])
+def test_keyword_arguments(with_stats):
+    stats = CipherStats() if with_stats else None
+    cipher = EncryptionManager(KEY, stats=stats)
+    text = _text(500)
+    cipher_text = cipher.encrypt(message=text)
+
+    assert cipher.decrypt(cipher_text=cipher_text) == text
+    assert cipher.decrypt_range(cipher_text=cipher_text, start=10, end=60) == text[10:60]
+    assert cipher.decrypt_bytes(data=cipher.encrypt_bytes(data=b"kilim")) == b"kilim"
+    if with_stats:
+        snapshot = stats.snapshot()
+        for operation, units in [("encrypt", 500), ("decrypt", len(cipher_text)), ("decrypt_range", len(cipher_text))]:
+            assert snapshot[operation]["count"] == 1
+            assert snapshot[operation]["units"] == units
+            assert not any(snapshot[operation]["errors"].values())